@@ -0,0 +1,65 @@
+import pytest
+from typed.mods.factories.arrays import _shape, _refines
+
+
+def test_shape_normalization():
+    assert _shape(None) is None
+    assert _shape(3) == (3,)
+    assert _shape(...) == (...,)
+    assert _shape([2, None, ...]) == (2, None, ...)
+    for bad in ((2, -1), (True,), (1.5,), (..., 2, ...)):
+        with pytest.raises(TypeError):
+            _shape(bad)
+
+
+def test_refines_with_wildcards():
+    assert _refines((2, 3), None)
+    assert not _refines(None, (2, 3))
+    assert _refines((2, 3), (2, 3))
+    assert _refines((2, 3), (None, 3))
+    assert not _refines((None, 3), (2, 3))
+    assert not _refines((2, 3), (2, 3, 1))
+    assert _refines((2, 3, 4), (...,))
+    assert _refines((2, 3, 4), (2, ...))
+    assert _refines((2, 3, 4), (..., 4))
+    assert _refines((2, 3, 4), (2, ..., 4))
+    assert not _refines((2,), (2, ..., 4))
+    assert not _refines((2, 3, 4), (3, ...))
+    assert _refines((2, ..., 4), (2, ...))
+    assert _refines((2, 5, ..., 4), (2, ..., 4))
+    assert not _refines((..., 4), (2, ..., 4))
+    assert not _refines((2, ...), (2, 3))
+
+
+def test_array_terms():
+    np = pytest.importorskip("numpy")
+    from typed.mods.core import isterm
+    from typed.mods.factories.arrays import Array
+
+    x = np.zeros((4, 3), dtype=np.int64)
+    assert isterm(x, Array)
+    assert not isterm([[0, 0, 0]], Array)
+    assert isterm(x, Array(np.int64, shape=(None, 3)))
+    assert isterm(x, Array(np.integer, shape=(..., 3)))
+    assert not isterm(x, Array(np.floating))
+    assert not isterm(x, Array(shape=(3, None)))
+    assert isterm(x, Array(order="C"))
+    assert not isterm(x, Array(order="F"))
+    assert isterm(np.asfortranarray(x), Array(order="F"))
+
+
+def test_array_subtypes_and_interning():
+    np = pytest.importorskip("numpy")
+    from typed.mods.core import issub
+    from typed.mods.factories.arrays import Array
+
+    assert Array("int64") is Array(np.int64)
+    assert Array(np.dtype("int64")) is Array(np.int64)
+    assert Array(np.integer) is not Array(np.int64)
+    assert issub(Array(np.int64), Array(np.integer))
+    assert not issub(Array(np.integer), Array(np.int64))
+    assert not issub(Array(np.int64), Array(np.floating))
+    assert issub(Array(np.int64, shape=(2, 3)), Array(shape=(None, 3)))
+    assert not issub(Array(shape=(None, 3)), Array(shape=(2, 3)))
+    assert issub(Array(np.int64, order="C"), Array(np.int64))
+    assert not issub(Array(np.int64), Array(np.int64, order="C"))
@@ -0,0 +1,111 @@
+from typed.mods.core import isterm
+from typed.mods.types.base import Bytes, Str, Int, Float, List, Tuple, Dict
+from typed.helper.core import _walk
+
+
+def test_bytes_admits_bytes_and_bytearray():
+    assert isterm(b"ab", Bytes)
+    assert isterm(bytearray(b"ab"), Bytes)
+    assert not isterm("ab", Bytes)
+    assert not isterm(bytearray(b"ab"), Str)
+
+
+class Items(dict):
+    passes = 0
+
+    def items(self):
+        Items.passes += 1
+        return super().items()
+
+    def keys(self):
+        raise AssertionError("keys walked apart from values")
+
+    def values(self):
+        raise AssertionError("values walked apart from keys")
+
+
+def test_dict_walks_keys_and_values_in_one_pass():
+    typ = Dict(List(Int), key=Str)
+    assert isterm(Items(a=[1], b=[2]), typ)
+    assert Items.passes == 1
+    assert _walk(typ, {"a": [1], 2: [1]}) == [2]
+    assert _walk(typ, {"a": [1], "b": [1, "x"]}) == ["b", 1]
+    assert isterm({1: "a"}, Dict(key=Int))
+    assert not isterm({1: "a"}, Dict(Int))
+
+
+def test_only_typed_sequences_accept_buffers_of_their_format():
+    from array import array
+    assert isterm(array("q", [1, 2]), List(Int))
+    assert isterm(array("d", [1.0]), Tuple(Float))
+    assert not isterm(array("d", [1.0]), List(Int))
+    assert not isterm(array("u", "ab"), List)
+    assert not isterm(array("u", "ab"), List(Str))
+    assert not isterm(memoryview(bytearray(b"ab")), Tuple)
+    assert not isterm(array("q", [1]), List)
+
+
+def test_typemap_changes_reach_the_dispatch_tables():
+    from typed.mods.core import TYPESYSTEM, typeof
+
+    class My:
+        pass
+
+    assert not isterm(My(), Int)
+    assert not isterm([My()], List(Int))
+    TYPESYSTEM.typemap[My] = Int
+    try:
+        assert typeof(My()) is Int
+        assert isterm(My(), Int)
+        assert isterm([My()], List(Int))
+    finally:
+        del TYPESYSTEM.typemap[My]
+    assert not isterm(My(), Int)
+
+
+def test_typemap_resolves_through_the_mro():
+    from collections import OrderedDict
+    from enum import IntEnum
+    from typed.mods.core import typemap
+
+    class Color(IntEnum):
+        RED = 1
+
+    assert typemap(Color) is Int
+    assert typemap(OrderedDict) is Dict
+    assert isterm(Color.RED, Int)
+    assert isterm(OrderedDict(a=1), Dict(Int))
+
+
+def test_typemap_registration_invalidates_resolved_classes():
+    from typed.mods.core import TYPESYSTEM, typemap
+
+    class Base(int):
+        pass
+
+    class Child(Base):
+        pass
+
+    assert typemap(Child) is Int
+    TYPESYSTEM.typemap[Base] = Str
+    try:
+        assert typemap(Child) is Str
+    finally:
+        del TYPESYSTEM.typemap[Base]
+    assert typemap(Child) is Int
+
+
+def test_typemap_does_not_retain_resolved_classes():
+    import gc
+    from weakref import ref
+    from typed.mods.core import TYPESYSTEM, typemap
+
+    class Temp(int):
+        pass
+
+    assert typemap(Temp) is Int
+    alive = ref(Temp)
+    del Temp
+    gc.collect()
+    assert alive() is None
+    assert not any(c.__name__ == "Temp" for c in TYPESYSTEM.typemap.resolved)
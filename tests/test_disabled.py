@@ -0,0 +1,68 @@
+import pytest
+from typed.mods.config import config
+from typed.mods.decorator import typed, factory
+from typed.mods.loader import __typed__
+from typed.mods.types.base import Int
+
+
+@pytest.fixture
+def disabled():
+    enabled = config.enabled
+    config.enabled = False
+    try:
+        yield
+    finally:
+        config.enabled = enabled
+
+
+def test_loader_keeps_enabled_unless_given(disabled):
+    scope = {"__name__": "scope", "__typed__": __typed__}
+    exec("__typed__(sample=0)", scope)
+    assert config.enabled is False
+    exec("__typed__(enabled=True)", scope)
+    assert config.enabled is True
+
+
+def test_disabled_typed_returns_the_function_itself(disabled):
+    def add(x: Int, y: Int) -> Int:
+        return x + y
+
+    f = typed(add)
+    assert f is add
+    assert f(1, 2) == 3
+    assert not hasattr(add, "domain")
+
+    g = typed(add, cache=True)
+    assert g is not add
+    assert g(1, 2) == 3
+    assert g.domain == (Int, Int)
+    assert g.codomain is Int
+
+
+def test_disabled_typed_keeps_cache_and_enclose(disabled):
+    calls = []
+
+    @typed(cache=True)
+    def square(x: Int) -> Int:
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert calls == [3]
+
+    @typed(enclose=ValueError, message="failed: {e}")
+    def fail(x: Int) -> Int:
+        raise KeyError(x)
+
+    with pytest.raises(ValueError, match="failed"):
+        fail(1)
+
+
+def test_disabled_factory_is_memoized(disabled):
+    def make(n: Int) -> Int:
+        return object()
+
+    f = factory(make)
+    assert f(1) is f(1)
+    assert not hasattr(make, "domain")
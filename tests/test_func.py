@@ -0,0 +1,173 @@
+from functools import partial
+import pytest
+from typed.mods.decorator import typed
+from typed.mods.types.base import Int, Float, Str, List, Any
+from typed.mods.types.func import Typed, Partial
+from typed.mods.err import DomErr, CodErr
+from typed.helper.core import STATEFUL, _
+
+
+def add(x: Int, y: Int) -> Int:
+    return x + y
+
+
+def compiled(f):
+    return f.__dict__["__compiled__"][1]
+
+
+def test_typed_call_goes_through_compiled_wrapper():
+    f = typed(add, lazy=False)
+    assert isinstance(f, Typed)
+    assert f(1, 2) == 3
+    call = compiled(f)
+    assert not isinstance(call, partial)
+    assert call.__wrapped__ is add
+    assert call.__name__ == "add"
+
+
+def test_lazy_typed_call_goes_through_compiled_wrapper():
+    f = typed(add)
+    assert f(2, 3) == 5
+    assert compiled(f.materialize()).__wrapped__ is add
+
+
+def test_compiled_wrapper_reports_domain_and_codomain_errors():
+    f = typed(add, lazy=False)
+    with pytest.raises(DomErr):
+        f(1, "a")
+
+    @typed(lazy=False)
+    def wrong(x: Int) -> Str:
+        return x
+
+    with pytest.raises(CodErr):
+        wrong(1)
+
+
+def test_compiled_wrapper_keeps_defaults_and_keyword_only_params():
+    @typed(lazy=False)
+    def scale(x: Int, /, y: Int = 2, *, z: Int = 3) -> Int:
+        return x * y * z
+
+    assert scale(1) == 6
+    assert scale(1, 4, z=5) == 20
+    with pytest.raises(DomErr):
+        scale(1, z="a")
+
+
+def test_placeholder_defers_to_partial_application():
+    f = typed(add, lazy=False)
+    p = f(_, 2)
+    assert isinstance(p, Partial)
+
+
+def test_compiled_wrapper_is_rebuilt_on_typesystem_change():
+    f = typed(add, lazy=False)
+    f(1, 2)
+    call = compiled(f)
+    STATEFUL.__reset__()
+    assert f(1, 2) == 3
+    assert compiled(f) is not call
+
+
+def test_compiled_wrapper_caches_argument_classes_inline():
+    f = typed(add, lazy=False)
+    assert f(1, 2) == 3
+    inline = compiled(f).__inline__
+    assert (int, int) in inline.keys
+    assert f(3, 4) == 7
+    assert len(inline.keys) == 1
+    with pytest.raises(DomErr):
+        f(1.5, 2)
+    assert (float, int) not in inline.keys
+
+
+def test_failed_call_resets_the_backoff_streak():
+    @typed(lazy=False, backoff=2)
+    def head(x: List(Int)) -> Int:
+        return x[0]
+
+    assert head([1]) == 1
+    with pytest.raises(DomErr):
+        head([1, "a"])
+    assert head([2]) == 2
+    with pytest.raises(DomErr):
+        head([1, "a"])
+    assert head([3]) == 3
+    assert head([4]) == 4
+    assert head([1, "a"]) == 1
+    sampler = head.__dict__["__sampler__"]
+    assert sampler.stats()["skipped"] == 1
+
+
+def test_backoff_streaks_are_bounded():
+    @typed(lazy=False, backoff=1)
+    def first(x: Any) -> Any:
+        return x
+
+    from typed.mods.config import config
+    streaks = config.streaks
+    config.streaks = 5
+    try:
+        for i in range(20):
+            first(type(f"C{i}", (), {})())
+        sampler = first.__dict__["__sampler__"]
+        assert sampler.maxsize == 5
+        assert len(sampler.streaks) == 5
+    finally:
+        config.streaks = streaks
+
+
+def test_function_errors_keep_the_backoff_streak():
+    @typed(lazy=False, backoff=2)
+    def inverse(x: Int) -> Float:
+        return 1 / x
+
+    assert inverse(1) == 1.0
+    with pytest.raises(ZeroDivisionError):
+        inverse(0)
+    assert inverse(2) == 0.5
+    assert inverse(4) == 0.25
+    assert inverse.__dict__["__sampler__"].stats()["skipped"] == 1
+
+
+def test_calls_go_through_the_bound_wrapper():
+    f = typed(add, lazy=False)
+    assert f(1, 2) == 3
+    assert f.__dict__["__hot__"] is compiled(f)
+    lazy = typed(add)
+    assert lazy(1, 2) == 3
+    assert lazy.__dict__["__hot__"] is compiled(lazy.materialize())
+
+
+def test_bound_wrapper_follows_levels_options_and_config():
+    from typed.mods.core import checks
+    from typed.mods.config import config
+
+    @typed(lazy=False)
+    def ident(x: Int) -> Int:
+        return x
+
+    assert ident(1) == 1
+    with checks("off"):
+        assert ident("a") == "a"
+    with pytest.raises(DomErr):
+        ident("a")
+
+    f = typed(add, lazy=False)
+
+    f.every = 2
+    assert "__hot__" not in f.__dict__
+    f.every = None
+    assert f(1, 2) == 3
+
+    config.every = 1000
+    try:
+        assert "__hot__" not in f.__dict__
+        f(1, 2)
+        f(1, 2)
+        assert f.calls["skipped"] >= 1
+    finally:
+        config.every = 0
+    with pytest.raises(DomErr):
+        f(1, "a")
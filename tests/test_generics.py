@@ -0,0 +1,98 @@
+from array import array
+from typed.mods.core import isterm, issub, null, mismatch
+from typed.mods.factories.generics import Interval, Range, Enum, Filter, Union, Maybe, Prod
+from typed.mods.types.base import Int, Str, Bool, List, Tuple
+
+
+def test_interval_terms_and_mask():
+    typ = Interval(Int, 0, 10)
+    assert isterm(5, typ)
+    assert not isterm(11, typ)
+    assert not isterm("a", typ)
+    assert issub(typ, Int)
+    assert null(typ) == 0
+    assert isterm([1, 2], List(typ))
+    assert not isterm([1, 20], List(typ))
+    assert typ.mask([1, 20, "a"]) == [True, False, False]
+    assert typ.check_all([1, 2, 30]) == 2
+    assert typ.check_all([1, 2]) is None
+
+
+def test_interval_mask_of_a_typed_buffer():
+    typ = Interval(Int, 0, 10, ops=("<=", "<"))
+    assert list(typ.mask(array("q", [0, 10, 3]))) == [True, False, True]
+    assert typ.check_all(array("q", [0, 3])) is None
+    assert typ.check_all(array("q", [0, 10])) == 1
+
+
+def test_range():
+    typ = Range(0, 3)
+    assert isterm(3, typ)
+    assert not isterm(4, typ)
+
+
+def test_enum_terms_and_mask():
+    typ = Enum(Str, "a", "b")
+    assert isterm("a", typ)
+    assert not isterm("c", typ)
+    assert not isterm([1], typ)
+    assert issub(typ, Str)
+    assert typ.mask(["a", "c", 1]) == [True, False, False]
+    assert typ.check_all(["a", "c"]) == 1
+    assert typ.check_all(["b", "a"]) is None
+    assert null(Enum(Int, 0, 1)) == 0
+
+
+def test_filter_terms_and_mask():
+    def positive(x: Int) -> Bool:
+        return x > 0
+
+    typ = Filter(Int, positive)
+    assert isterm(1, typ)
+    assert not isterm(-1, typ)
+    assert not isterm("a", typ)
+    assert typ.mask([1, -1, "a"]) == [True, False, False]
+    assert typ.check_all([1, -1]) == 1
+
+
+def test_union_and_maybe_terms_and_subtypes():
+    union = Union(Int, Str)
+    maybe = Maybe(Int)
+    assert Union(Int, Str) is union
+    assert Union(Int) is Int
+    assert isterm(1, union) and isterm("a", union)
+    assert not isterm(1.0, union)
+    assert isterm(None, maybe) and isterm(1, maybe)
+    assert not isterm("a", maybe)
+    assert null(union) == 0
+    assert issub(union, Union(Int, Str, Bool))
+    assert not issub(union, Union(Int, Bool))
+    assert issub(Union(Range(0, 9), Str), union)
+    assert issub(maybe, Maybe(Int, Str))
+    assert not issub(maybe, union)
+
+
+def test_union_and_maybe_spread_their_alternatives_when_walked():
+    assert mismatch([1, "a", 2.0], List(Union(Int, Str))) == [2]
+    assert mismatch([[1], "a", [1, "b"]], List(Union(List(Int), Str))) == [2, 1]
+    assert mismatch([[1], "a"], List(Union(List(Int), Str))) is None
+    assert isterm([[1], None], List(Maybe(List(Int))))
+    assert mismatch([[1], [None]], List(Maybe(List(Int)))) == [1, 0]
+
+
+def test_prod_walks_its_positions():
+    typ = Prod(Int, Str)
+    assert Prod(Int, 2).__types__ == (Int, Int)
+    assert isterm((1, "a"), typ)
+    assert not isterm(("a", 1), typ)
+    assert not isterm((1,), typ)
+    assert not isterm([1, "a"], typ)
+    assert typ(1, "a") == (1, "a") and isterm(typ(1, "a"), typ)
+    assert null(typ) == (0, "")
+    assert mismatch((1, [1, "x"]), Prod(Int, List(Int))) == [1, 1]
+    assert mismatch((1, [1]), Prod(Int, List(Int))) is None
+    assert mismatch(("a", "b"), typ) == [0]
+    assert issub(Prod(Range(0, 9), Str), typ)
+    assert not issub(typ, Prod(Range(0, 9), Str))
+    assert issub(typ, Tuple(Int, Str))
+    assert not issub(typ, Prod(Str, Int))
@@ -0,0 +1,84 @@
+from threading import Barrier, Thread
+from typed.mods.core import issub, isterm
+from typed.mods.meta.base import TYPE
+from typed.mods.types.base import Int, List
+from typed.helper.core import STATEFUL
+
+
+def run(target, n):
+    errors = []
+
+    def work(i):
+        try:
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [Thread(target=work, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+
+def clean():
+    guards = STATEFUL.GUARDS
+    assert guards.subs == {}
+    assert guards.sups == {}
+    assert guards.terms == set()
+    assert guards.depth == 0
+
+
+def test_guards_are_not_shared_between_threads():
+    barrier = Barrier(2, timeout=5)
+
+    class Slow(metaclass=TYPE):
+        __display__ = "Slow"
+
+        def __issub__(typ, other):
+            if other is Int:
+                barrier.wait()
+                return True
+            return NotImplemented
+
+    results = []
+
+    def check(i):
+        results.append(issub(Slow, Int))
+        clean()
+
+    run(check, 2)
+    assert results == [True, True]
+
+
+def test_recursive_checks_under_concurrency():
+    def pair():
+        class A(metaclass=TYPE):
+            __display__ = "A"
+
+            def __issub__(typ, other):
+                return issub(B, other)
+
+        class B(metaclass=TYPE):
+            __display__ = "B"
+
+            def __issub__(typ, other):
+                return issub(A, other)
+
+        return A, B
+
+    cyclic = []
+    cyclic.append(cyclic)
+
+    def check(i):
+        for _ in range(200):
+            A, B = pair()
+            assert issub(A, Int) is False
+            assert issub(A, A) is True
+            assert isterm(cyclic, List(List)) is True
+            assert isterm([1, "a"], List(Int)) is False
+            clean()
+
+    run(check, 8)
+    clean()
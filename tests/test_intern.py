@@ -0,0 +1,54 @@
+import gc
+from typed.helper.core import STATEFUL, _intern
+from typed.mods.factories.generics import Interval
+from typed.mods.types.base import Int, Str, List, Tuple, Set, Dict
+from typed.mods.types.func import DomFunc
+
+
+def _key(typ):
+    return next(k for k, v in STATEFUL.INTERNED.items() if v is typ)
+
+
+def test_intern_builds_once():
+    calls = []
+
+    class Built:
+        pass
+
+    def build():
+        calls.append(1)
+        return Built()
+
+    first = _intern(("test_intern", 1), build)
+    assert _intern(("test_intern", 1), build) is first
+    assert len(calls) == 1
+
+
+def test_parametric_types_are_interned():
+    assert List(Int) is List(Int)
+    assert Set(Int, Str) is Set(Int, Str)
+    assert Dict(Int, key=Str) is Dict(Int, key=Str)
+    assert Dict(Int, key=Str) is not Dict(Str, key=Int)
+    assert List(Int, sample=2) is List(Int, sample=2)
+    assert List(Int, sample=2) is not List(Int)
+
+
+def test_unordered_parameters_are_interned_by_set():
+    assert List(Int, Str) is List(Str, Int)
+    assert Tuple(Int, Str) is Tuple(Str, Int)
+    assert List(Int, Int) is List(Int)
+    assert Dict(Int, Str, key=Str) is Dict(Str, Int, key=Str)
+
+
+def test_domain_types_are_interned_in_order():
+    assert DomFunc(Int, Str) is DomFunc(Int, Str)
+    assert DomFunc(Int, Str) is not DomFunc(Str, Int)
+
+
+def test_interned_types_are_collected():
+    typ = List(Interval(Int, 0, 1000))
+    key = _key(typ)
+    assert STATEFUL.INTERNED[key] is typ
+    del typ
+    gc.collect()
+    assert key not in STATEFUL.INTERNED
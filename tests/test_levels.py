@@ -0,0 +1,25 @@
+import pytest
+from typed.mods.core import isterm, checks
+from typed.mods.containers import TypedList, TypedDict
+from typed.mods.types.base import Int, Str, List, Dict
+
+
+@pytest.mark.parametrize("level", ["off", "shallow"])
+def test_typed_containers_check_fully_at_any_level(level):
+    nested = List(List(Int))
+    with checks(level):
+        with pytest.raises(TypeError):
+            TypedList(nested, [["a"]])
+        xs = TypedList(nested, [[1]])
+        with pytest.raises(TypeError):
+            xs.append(["a"])
+        with pytest.raises(TypeError):
+            TypedDict(Dict(List(Int), key=Str), a=["a"])
+    assert isterm(xs, nested)
+
+
+def test_off_checks_only_the_class_of_containers():
+    with checks("off"):
+        assert isterm(["a"], List(Int))
+        assert not isterm("a", List(Int))
+    assert not isterm(["a"], List(Int))
@@ -0,0 +1,73 @@
+import gc
+import pytest
+from typed.mods.config import config
+from typed.mods.core import isterm, issub, issup, memo
+from typed.mods.decorator import typed
+from typed.mods.factories.generics import Filter
+from typed.mods.types.base import Int, Bool, Tuple, List
+from typed.helper.core import STATEFUL
+
+
+@pytest.fixture
+def memoized():
+    size = config.memo
+    config.memo = 100
+    STATEFUL.TERMS = type(STATEFUL.TERMS)()
+    try:
+        yield
+    finally:
+        config.memo = size
+        STATEFUL.TERMS = type(STATEFUL.TERMS)()
+
+
+def test_memo_hits_and_misses(memoized):
+    assert isterm((1, 2), Tuple(Int))
+    assert isterm((1, 2), Tuple(Int))
+    assert not isterm((1, "a"), Tuple(Int))
+    assert memo() == {"hits": 1, "misses": 2, "size": 2, "maxsize": 100}
+
+
+def test_memo_skips_mutable_values_and_impure_types(memoized):
+    def positive(x: Int) -> Bool:
+        return x > 0
+
+    assert isterm([1, 2], List(Int))
+    assert isterm(1, Filter(Int, positive))
+    assert isterm((1, 2), Tuple(Int, sample=1))
+    memoized = {typ for typ, _ in STATEFUL.TERMS.data.values()}
+    assert memoized <= {Int}
+
+
+def test_sampled_verdicts_are_not_memoized(memoized):
+    def nonempty(x: Tuple(Int)) -> Bool:
+        return len(x) > 0
+
+    @typed(lazy=False, sample=4)
+    def first(x: Filter(Tuple(Int), nonempty)) -> Int:
+        return x[0]
+
+    bad = (1,) * 25 + ("x",) + (1,) * 24
+    assert first(bad) == 1
+    assert not isterm(bad, Tuple(Int))
+
+    config.sample = 4
+    try:
+        assert isterm(bad, Tuple(Int))
+    finally:
+        config.sample = 0
+    assert not isterm(bad, Tuple(Int))
+
+
+def test_verdicts_of_collected_types_are_dropped_on_both_sides():
+    issub(Int, Int)
+    before = len(STATEFUL.PAIRS.get(id(Int), ()))
+    for i in range(500):
+        cls = type(f"T{i}", (), {})
+        assert not issub(cls, Int)
+        assert not issup(cls, Int)
+        del cls
+    gc.collect()
+    assert len(STATEFUL.PAIRS.get(id(Int), ())) <= before + 2
+    assert len(STATEFUL.SUBS_MEMO) < 100
+    assert len(STATEFUL.SUPS_MEMO) < 100
+    assert all(STATEFUL.PAIRS.values())
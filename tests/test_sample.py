@@ -0,0 +1,51 @@
+import pytest
+from typed.mods.core import isterm
+from typed.mods.decorator import typed
+from typed.mods.types.base import Int, List, Set
+from typed.mods.err import DomErr
+from typed.helper.core import STATEFUL, _sample
+
+
+class Counted:
+    def __init__(self, n):
+        self.n = n
+        self.seen = 0
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        for i in range(self.n):
+            self.seen += 1
+            yield i
+
+
+def test_sample_of_a_non_sequence_scans_a_bounded_prefix():
+    token = STATEFUL.SAMPLE.set(8)
+    try:
+        trm = Counted(100000)
+        keys, values = _sample(None, trm, indexed=True)
+    finally:
+        STATEFUL.SAMPLE.reset(token)
+    assert len(values) == 8
+    assert values == keys
+    assert keys[:4] == [0, 1, 2, 3]
+    assert trm.seen <= 32
+
+
+def test_sampled_flag_does_not_leak_out_of_checks():
+    token = STATEFUL.SAMPLE.set(8)
+    try:
+        assert isterm(set(range(1000)), Set(Int))
+    finally:
+        STATEFUL.SAMPLE.reset(token)
+    assert STATEFUL.SAMPLED.get() is None
+
+    @typed(lazy=False, sample=4)
+    def first(x: List(Int)) -> Int:
+        return x[0]
+
+    with pytest.raises(DomErr) as err:
+        first([0] * 99 + ["a"])
+    assert "sampled" in str(err.value)
+    assert STATEFUL.SAMPLED.get() is None
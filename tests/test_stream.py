@@ -0,0 +1,29 @@
+import pytest
+from typed.mods.core import isterm, issub
+from typed.mods.containers import TypedIterator, TypedIterable
+from typed.mods.types.base import Int, Iterator, Iterable
+
+
+def stream(typ, trm):
+    return type(typ).__stream__(typ, trm)
+
+
+def test_iterator_and_iterable_share_their_meta_base():
+    assert type(Iterator(Int)).__mro__[1] is type(Iterable(Int)).__mro__[1]
+    assert Iterator(Int).__display__ == "Iterator(Int)"
+    assert Iterable(Int).__display__ == "Iterable(Int)"
+    assert Iterator(Int) is Iterator(Int)
+    assert issub(Iterator(Int), Iterator)
+    assert not issub(Iterator, Iterator(Int))
+    assert not issub(Iterator(Int), Iterable(Int))
+
+
+def test_streams_wrap_their_own_checked_container():
+    assert isinstance(stream(Iterator(Int), iter([1])), TypedIterator)
+    assert isinstance(stream(Iterable(Int), [1]), TypedIterable)
+    assert list(stream(Iterable(Int), [1, 2])) == [1, 2]
+    it = stream(Iterator(Int), iter([1, "a"]))
+    assert next(it) == 1
+    with pytest.raises(TypeError):
+        next(it)
+    assert isterm(iter([1]), Iterator(Int))
@@ -0,0 +1,63 @@
+import gc
+from typed.mods.config import config
+from typed.mods.core import term, terms, track, isterm
+from typed.mods.types.base import Int, List, Dict, Bool
+
+
+def test_track_builds_one_subclass_per_builtin():
+    assert track(int) is track(int)
+    assert issubclass(track(int), int)
+    assert issubclass(track(list), list)
+    assert track(list).__weakrefoffset__
+
+
+def test_term_of_ints_is_not_retained_by_default():
+    x = term(5)
+    assert x == 5
+    assert isterm(x, Int)
+    assert x not in Int.__terms__
+    before = len(Int.__terms__)
+    for i in range(1000):
+        term(i)
+    assert len(Int.__terms__) == before
+
+
+def test_strong_terms_are_opt_in_and_bounded():
+    config.strong = 3
+    try:
+        xs = [term(i) for i in range(10)]
+        assert len(Int.__terms__.strong) == 3
+        assert all(x in Int.__terms__ for x in xs[-3:])
+        assert xs[0] not in Int.__terms__
+        assert any(t is xs[-1] for t in terms(Int))
+    finally:
+        config.strong = 0
+        Int.__terms__.strong.clear()
+
+
+def test_term_registers_lists_and_dicts():
+    xs = term([1])
+    d = term({"a": 1})
+    assert xs == [1] and isinstance(xs, list)
+    assert d == {"a": 1} and isinstance(d, dict)
+    assert xs in List.__terms__
+    assert d in Dict.__terms__
+
+
+def test_weakly_referable_terms_are_dropped():
+    xs = term([2])
+    before = len(List.__terms__)
+    del xs
+    gc.collect()
+    assert len(List.__terms__) == before - 1
+
+
+def test_unsubclassable_builtins_keep_the_value():
+    config.strong = 1
+    try:
+        x = term(True, Bool)
+        assert x is True
+        assert x in Bool.__terms__
+    finally:
+        config.strong = 0
+        Bool.__terms__.strong.clear()
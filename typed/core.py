@@ -7,7 +7,7 @@ __imports__ = {
         "typeof", "typemap",
         "new", "kind", "terms",
         "isterm", "issub", "issup",
-        "name", "null"
+        "name", "null", "memo", "mismatch", "checks"
     ]
 }
 
@@ -18,5 +18,5 @@ if lazy(__imports__):
         typeof, typemap,
         new, kind, terms,
         isterm, issub, issup,
-        name, null
+        name, null, memo, mismatch, checks
 )
@@ -0,0 +1,56 @@
+from sys import modules
+from itertools import compress, count
+from operator import not_
+from typed.helper.core import _checker, _format
+
+def _typed(base, values):
+    """
+    Check if the elements of 'values' are known to be terms
+    of 'base' from the buffer format 'values' exports.
+    """
+    fmt = _format(values)
+    return fmt is not None and fmt in getattr(base, "__dict__", {}).get("__formats__", ())
+
+def _array(base, values):
+    """
+    The numpy array over 'values' if numpy is loaded and
+    its elements are known to be terms of 'base', else None.
+    """
+    np = modules.get("numpy")
+    if np is None or not _typed(base, values):
+        return None
+    return np.asarray(values)
+
+def _mask(typ, values, base, vector=None, known=None):
+    """
+    The boolean mask of the terms of 'typ' among 'values'.
+    When the elements of 'values' are known to be terms of
+    'base', 'vector' computes it over the numpy array of them
+    and 'known' lazily over them, without checking each one.
+    """
+    if vector is not None:
+        arr = _array(base, values)
+        if arr is not None:
+            return vector(arr)
+    if known is not None and _typed(base, values):
+        return list(known(values))
+    return list(map(_checker(typ), values))
+
+def _first(typ, values, base, vector=None, known=None):
+    """
+    The index of the first of 'values' which is not a term
+    of 'typ', or None if all of them are, as in '_mask'.
+    """
+    if vector is not None:
+        arr = _array(base, values)
+        if arr is not None:
+            if not len(arr):
+                return None
+            mask = vector(arr)
+            i = int(mask.argmin())
+            return None if mask[i] else i
+    if known is not None and _typed(base, values):
+        oks = known(values)
+    else:
+        oks = map(_checker(typ), values)
+    return next(compress(count(), map(not_, oks)), None)
@@ -1,166 +1,930 @@
+from threading import local, Lock
+from collections import OrderedDict
+from itertools import islice
+from contextvars import ContextVar
+from weakref import WeakKeyDictionary, WeakValueDictionary, WeakSet
+from typed.mods.config import config
+
+class GUARDS(local):
+    """
+    The recursion guards of the running thread.
+    """
+    def __init__(self):
+        self.subs  = {}
+        self.sups  = {}
+        self.terms = set()
+        self.depth = 0
+        self.low   = float("inf")
+
 class STATEFUL:
-    SUBS  = set()
-    SUPS  = set()
-    TERMS = set()
+    GUARDS    = GUARDS()
+    CHECKERS  = {}
+    SUBS_MEMO = {}
+    SUPS_MEMO = {}
+    REFS      = {}
+    PAIRS     = {}
+    DISPATCH  = set()
+    TRACKS    = WeakKeyDictionary()
+    INTERNED  = WeakValueDictionary()
+    SAMPLE    = ContextVar("SAMPLE", default=None)
+    SAMPLED   = ContextVar("SAMPLED", default=None)
+    DEPTH     = ContextVar("DEPTH", default=2)
+    EPOCH     = 0
+    BUFFERS   = {}
+    TERMS     = None
+    HOT       = WeakSet()
+    OFF       = 0
 
     @staticmethod
     def __issup__(typ, other):
         key = (id(typ), id(other))
-        if key in STATEFUL.SUPS:
+        try:
+            return STATEFUL.SUPS_MEMO[key]
+        except KeyError:
+            pass
+        guards = STATEFUL.GUARDS
+        guard = guards.sups
+        if key in guard:
+            guards.low = min(guards.low, guard[key])
             return False
 
-        STATEFUL.SUPS.add(key)
+        depth, low = guards.depth, guards.low
+        guard[key] = depth
+        guards.depth, guards.low = depth + 1, float("inf")
         try:
-            from typed.mods.core import extends
-            if extends(typ, other):
-                return True
-
-            if "__issup__" in getattr(typ, "__dict__", {}):
-                issup_func = typ.__dict__["__issup__"]
-                if issup_func is not STATEFUL.__issup__:
-                    try:
-                        res = issup_func(typ, other)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
-
-            meta_typ = type(typ)
-            if hasattr(meta_typ, "__issup__"):
-                issup_func = getattr(meta_typ, "__issup__")
-                if issup_func is not STATEFUL.__issup__:
-                    try:
-                        res = issup_func(typ, other)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
-
-            if "__issub__" in getattr(other, "__dict__", {}):
-                issub_func = other.__dict__["__issub__"]
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(other, typ)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+            res = STATEFUL.__supcheck__(typ, other)
+        finally:
+            del guard[key]
+            mine = guards.low
+            guards.depth, guards.low = depth, min(low, mine)
+        if mine >= depth:
+            STATEFUL.__remember__(STATEFUL.SUPS_MEMO, key, typ, other, res)
+        return res
 
-            meta_other = type(other)
-            if hasattr(meta_other, "__issub__"):
-                issub_func = getattr(meta_other, "__issub__")
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(other, typ)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+    @staticmethod
+    def __supcheck__(typ, other):
+        from typed.mods.core import extends
+        if extends(typ, other):
+            return True
 
-            return False
-        finally:
-            STATEFUL.SUPS.remove(key)
+        if "__issup__" in getattr(typ, "__dict__", {}):
+            issup_func = typ.__dict__["__issup__"]
+            if issup_func is not STATEFUL.__issup__:
+                try:
+                    res = issup_func(typ, other)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        meta_typ = type(typ)
+        if hasattr(meta_typ, "__issup__"):
+            issup_func = getattr(meta_typ, "__issup__")
+            if issup_func is not STATEFUL.__issup__:
+                try:
+                    res = issup_func(typ, other)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        if "__issub__" in getattr(other, "__dict__", {}):
+            issub_func = other.__dict__["__issub__"]
+            if issub_func is not STATEFUL.__issub__:
+                try:
+                    res = issub_func(other, typ)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        meta_other = type(other)
+        if hasattr(meta_other, "__issub__"):
+            issub_func = getattr(meta_other, "__issub__")
+            if issub_func is not STATEFUL.__issub__:
+                try:
+                    res = issub_func(other, typ)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        return False
 
     @staticmethod
     def __issub__(typ, other):
         key = (id(typ), id(other))
-        if key in STATEFUL.SUBS:
+        try:
+            return STATEFUL.SUBS_MEMO[key]
+        except KeyError:
+            pass
+        if config.index:
+            res = _indexed(typ, other)
+            if res is not None:
+                return res
+        guards = STATEFUL.GUARDS
+        guard = guards.subs
+        if key in guard:
+            guards.low = min(guards.low, guard[key])
             return False
-        STATEFUL.SUBS.add(key)
+
+        depth, low = guards.depth, guards.low
+        guard[key] = depth
+        guards.depth, guards.low = depth + 1, float("inf")
         try:
-            from typed.mods.core import extends
-            if extends(other, typ):
-                return True
+            res = STATEFUL.__subcheck__(typ, other)
+        finally:
+            del guard[key]
+            mine = guards.low
+            guards.depth, guards.low = depth, min(low, mine)
+        if mine >= depth:
+            STATEFUL.__remember__(STATEFUL.SUBS_MEMO, key, typ, other, res)
+        return res
 
-            if "__issub__" in getattr(typ, "__dict__", {}):
-                issub_func = typ.__dict__["__issub__"]
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(typ, other)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+    @staticmethod
+    def __subcheck__(typ, other):
+        from typed.mods.core import extends
+        if extends(other, typ):
+            return True
 
-            meta_typ = type(typ)
-            if hasattr(meta_typ, "__issub__"):
-                issub_func = getattr(meta_typ, "__issub__")
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(typ, other)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+        if "__issub__" in getattr(typ, "__dict__", {}):
+            issub_func = typ.__dict__["__issub__"]
+            if issub_func is not STATEFUL.__issub__:
+                try:
+                    res = issub_func(typ, other)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        meta_typ = type(typ)
+        if hasattr(meta_typ, "__issub__"):
+            issub_func = getattr(meta_typ, "__issub__")
+            if issub_func is not STATEFUL.__issub__:
+                try:
+                    res = issub_func(typ, other)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        if "__issup__" in getattr(other, "__dict__", {}):
+            issup_func = other.__dict__["__issup__"]
+            if issup_func is not STATEFUL.__issup__:
+                try:
+                    res = issup_func(other, typ)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        meta_other = type(other)
+        if hasattr(meta_other, "__issup__"):
+            issup_func = getattr(meta_other, "__issup__")
+            if issup_func is not STATEFUL.__issup__:
+                try:
+                    res = issup_func(other, typ)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+
+        return False
 
-            if "__issup__" in getattr(other, "__dict__", {}):
-                issup_func = other.__dict__["__issup__"]
-                if issup_func is not STATEFUL.__issup__:
-                    try:
-                        res = issup_func(other, typ)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+    @staticmethod
+    def __remember__(memo, key, typ, other, res):
+        """
+        Store a subtyping verdict, keyed by the identities of
+        'typ' and 'other' and dropped when any of them is collected.
+        """
+        from weakref import ref
+        refs = STATEFUL.REFS
+        try:
+            for t in (typ, other):
+                i = id(t)
+                if i not in refs:
+                    refs[i] = ref(t, lambda _, i=i: STATEFUL.__forget__(i))
+        except TypeError:
+            return
+        memo[key] = res
+        pairs = STATEFUL.PAIRS
+        pairs.setdefault(key[0], set()).add(key)
+        pairs.setdefault(key[1], set()).add(key)
 
-            meta_other = type(other)
-            if hasattr(meta_other, "__issup__"):
-                issup_func = getattr(meta_other, "__issup__")
-                if issup_func is not STATEFUL.__issup__:
-                    try:
-                        res = issup_func(other, typ)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+    @staticmethod
+    def __forget__(i):
+        """
+        Drop the verdicts of the collected type of identity 'i',
+        also from the pairs of the types it was checked against.
+        """
+        STATEFUL.REFS.pop(i, None)
+        pairs = STATEFUL.PAIRS
+        for key in pairs.pop(i, ()):
+            STATEFUL.SUBS_MEMO.pop(key, None)
+            STATEFUL.SUPS_MEMO.pop(key, None)
+            other = key[1] if key[0] == i else key[0]
+            keys = pairs.get(other)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del pairs[other]
 
-            return False
-        finally:
-            STATEFUL.SUBS.remove(key)
+    @staticmethod
+    def __reset__():
+        """
+        Invalidate every memoized subtyping verdict.
+        """
+        STATEFUL.SUBS_MEMO.clear()
+        STATEFUL.SUPS_MEMO.clear()
+        STATEFUL.PAIRS.clear()
+        STATEFUL.EPOCH += 1
+        STATEFUL.TERMS.clear()
+        for meta in STATEFUL.DISPATCH:
+            meta.__dispatch__.clear()
+        STATEFUL.__rebind__()
+
+    @staticmethod
+    def __rebind__():
+        """
+        Drop the callables typed functions are called through,
+        so that they are decided again on their next call.
+        """
+        for obj in list(STATEFUL.HOT):
+            obj.__dict__.pop("__hot__", None)
+        STATEFUL.HOT.clear()
 
     @staticmethod
     def __isterm__(typ, trm):
-        key = (id(typ), id(trm))
-        if key in STATEFUL.TERMS:
-            return False
-        STATEFUL.TERMS.add(key)
-        try:
-            if "__isterm__" in getattr(typ, "__dict__", {}):
-                isterm_func = typ.__dict__["__isterm__"]
-                if isterm_func is not STATEFUL.__isterm__:
-                    try:
-                        res = isterm_func(typ, trm)
-                        if res is not NotImplemented: return res
-                    except TypeError:
-                        pass
+        return _checker(typ)(trm)
 
-            meta = type(typ)
-            if hasattr(meta, "__isterm__"):
-                isterm_func = getattr(meta, "__isterm__")
-                if isterm_func is not STATEFUL.__isterm__:
+    @staticmethod
+    def __fallback__(typ, trm):
+        trm_type = type(trm)
+        issub_func = trm_type.__dict__.get("__issub__")
+        if issub_func is not None and issub_func is not STATEFUL.__issub__:
+            try:
+                if issub_func(trm_type, typ): return True
+            except TypeError:
+                pass
+
+        issub_func = getattr(type(trm_type), "__issub__", None)
+        if issub_func is not None and issub_func is not STATEFUL.__issub__:
+            try:
+                if issub_func(trm_type, typ): return True
+            except TypeError:
+                pass
+
+        if isinstance(trm, type) and isinstance(typ, type):
+            if issubclass(trm, typ):
+                return True
+
+        return isinstance(trm, typ)
+
+    @staticmethod
+    def __compile__(typ):
+        """
+        Build the term checker of 'typ' from the
+        '__isterm__' hooks it and its metatype define.
+        The terms of the types decided by class alone
+        are first looked up in the '__dispatch__' table
+        of their metatype.
+        """
+        hooks = []
+        own = getattr(typ, "__dict__", {}).get("__isterm__")
+        if own is not None and own is not STATEFUL.__isterm__:
+            hooks.append(own)
+        meta = getattr(type(typ), "__isterm__", None)
+        if meta is not None and meta is not STATEFUL.__isterm__:
+            hooks.append(meta)
+        hooks = tuple(hooks)
+
+        fallback = STATEFUL.__fallback__
+        table = getattr(type(typ), "__dict__", {}).get("__dispatch__")
+
+        if not hooks:
+            def check(trm):
+                return fallback(typ, trm)
+        elif hooks == (meta,) and isinstance(table, dict) and _by_class(typ):
+            def check(trm):
+                try:
+                    return table[trm.__class__]
+                except KeyError:
+                    pass
+                try:
+                    res = meta(typ, trm)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+                return fallback(typ, trm)
+        elif len(hooks) == 1:
+            hook = hooks[0]
+            def check(trm):
+                try:
+                    res = hook(typ, trm)
+                    if res is not NotImplemented: return res
+                except TypeError:
+                    pass
+                return fallback(typ, trm)
+        else:
+            def check(trm):
+                for hook in hooks:
                     try:
-                        res = isterm_func(typ, trm)
+                        res = hook(typ, trm)
                         if res is not NotImplemented: return res
                     except TypeError:
                         pass
+                return fallback(typ, trm)
+
+        if not _recursive(typ):
+            check.__name__ = "__checker__"
+            return check
+
+        guards = STATEFUL.GUARDS
+        def __checker__(trm):
+            key = (id(typ), id(trm))
+            terms = guards.terms
+            if key in terms:
+                guards.low = -1
+                return False
+            terms.add(key)
+            try:
+                return check(trm)
+            finally:
+                terms.remove(key)
+        return __checker__
+
+def _indexed(typ, other):
+    """
+    Look up 'issub(typ, other)' in the bitset index of
+    the typesystems of 'typ', if both are indexed there.
+    """
+    for ts in getattr(typ, "__dict__", {}).get("__typesystems__", ()):
+        res = ts.index().issub(typ, other)
+        if res is not None:
+            return res
+    return None
+
+def _dispatch(meta, base, trm, classes=()):
+    """
+    Decide if the instances of 'type(trm)' are terms of the
+    builtin-backed type 'base', or of some of the builtin
+    'classes' it also stands for, and store it in
+    'meta.__dispatch__'.
+    """
+    from typed.mods.core import typemap, issub
+    cls = type(trm)
+    builtin = base.__dict__.get("__builtin__")
+    res = (
+        (isinstance(builtin, type) and issubclass(cls, builtin))
+        or issubclass(cls, classes)
+        or typemap(cls) is base
+        or issub(cls, base)
+    )
+    STATEFUL.DISPATCH.add(meta)
+    meta.__dispatch__[cls] = res
+    return res
+
+class ACCEPTED:
+    """
+    The concrete classes whose instances are known to be
+    terms of some of 'types', learned as elements are checked.
+    """
+    __slots__ = ("types", "walkers", "walks", "single", "classes", "formats", "epoch")
+
+    def __init__(self, types):
+        self.types = _alternatives(types)
+        self.walkers = tuple(_walker(t) for t in self.types)
+        self.walks = any(w is not None for w in self.walkers)
+        self.single = self.walkers[0] if len(self.types) == 1 else None
+        self.formats = frozenset(
+            f for t in self.types
+            for f in getattr(t, "__dict__", {}).get("__formats__", ())
+        )
+        self.epoch = STATEFUL.EPOCH
+        self.classes = frozenset(
+            t.__dict__["__builtin__"] for t in self.types
+            if _by_class(t) and isinstance(t.__dict__.get("__builtin__"), type)
+        )
 
-            if "__issub__" in getattr(type(trm), "__dict__", {}):
-                issub_func = type(trm).__dict__["__issub__"]
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(type(trm), typ)
-                        if res: return True
-                    except TypeError:
-                        pass
+    def learn(self, x):
+        for t in self.types:
+            if _checker(t)(x):
+                if _by_class(t):
+                    self.classes = self.classes | {type(x)}
+                return True
+        return False
+
+def _by_class(t):
+    """
+    Check if the terms of 't' are decided by their
+    concrete class alone, as for the builtin-backed types.
+    """
+    d = getattr(t, "__dict__", {})
+    return (
+        "__dispatch__" in getattr(type(t), "__dict__", {})
+        and "__isterm__" not in d
+        and d.get("__types__") is None
+        and d.get("__key_type__") is None
+    )
+
+def _alternatives(types):
+    """
+    The types a term may belong to in order to be a term
+    of some of 'types', with the '__alternatives__' of
+    union-like types spread out.
+    """
+    alts = []
+    for t in types:
+        spread = getattr(t, "__dict__", {}).get("__alternatives__")
+        if spread is None:
+            alts.append(t)
+        else:
+            alts.extend(_alternatives(spread))
+    return tuple(alts)
+
+def _walker(t):
+    """
+    The '__walk__' hook of the metatype of 't', if its
+    terms are checked by walking into their elements.
+    """
+    if _by_class(t):
+        return None
+    return getattr(type(t), "__walk__", None)
+
+def _accepted(typ, types, attr="__accepted__"):
+    """
+    The accepted classes of the parametric type 'typ',
+    rebuilt when the typesystem changed since last use.
+    """
+    accepted = typ.__dict__.get(attr)
+    if accepted is None or accepted.epoch != STATEFUL.EPOCH:
+        accepted = ACCEPTED(types)
+        type.__setattr__(typ, attr, accepted)
+    return accepted
+
+def _format(trm):
+    """
+    The struct format of the elements of 'trm', if it
+    exports a one-dimensional buffer other than bytes.
+    """
+    cls = type(trm)
+    if STATEFUL.BUFFERS.get(cls) is False:
+        return None
+    if isinstance(trm, (bytes, bytearray)):
+        STATEFUL.BUFFERS[cls] = False
+        return None
+    try:
+        view = memoryview(trm)
+    except TypeError:
+        STATEFUL.BUFFERS[cls] = False
+        return None
+    with view:
+        if view.ndim != 1:
+            return None
+        return view.format.lstrip("@=<>!")
+
+def _buffer(typ, trm):
+    """
+    The '__walk__' groups of a buffer 'trm' checked as a
+    sequence against 'typ': none if 'typ' has element types
+    and the format of 'trm' is one of the '__formats__' they
+    declare, so that it is accepted without looking at the
+    elements. Any other buffer is not a term of 'typ'.
+    """
+    types = getattr(typ, "__types__", None)
+    if not types:
+        return None
+    fmt = _format(trm)
+    if fmt is None or fmt not in _accepted(typ, types).formats:
+        return None
+    return ()
+
+_EXIT = object()
+
+def _walk(typ, trm):
+    """
+    Check 'trm' against the walked type 'typ' with a single
+    explicit stack of the nested nodes still to be checked,
+    instead of reentering 'isterm' for each level.
+
+    The '__walk__' hook of a metatype returns None if a term
+    fails it by itself, else the groups of its elements, as
+    (attr, types, values, keys) with the 'attr' its accepted
+    classes are kept in and the 'keys' of the 'values', or
+    None if they are their positions. A group whose 'attr'
+    and 'types' are pairs has (key, value) pairs as 'values',
+    checked in one pass by '_items'.
+
+    Returns None if 'trm' is a term of 'typ', else the path
+    of keys and indexes to the first failing node.
+    """
+    guards = STATEFUL.GUARDS
+    terms = guards.terms
+    stack = [(None, trm, typ)]
+    try:
+        while stack:
+            path, x, node = stack.pop()
+            if x is _EXIT:
+                terms.discard(node)
+                continue
+
+            if node.__class__ is ACCEPTED and node.single is not None:
+                t = node.types[0]
+                groups = node.single(t, x)
+                if groups is None:
+                    return _path(path)
+            elif node.__class__ is ACCEPTED:
+                found = _resolve(x, node)
+                if found is True:
+                    continue
+                if found is None:
+                    return _path(path)
+                t, groups = found
+            else:
+                t, groups = node, type(node).__walk__(node, x)
+                if groups is None:
+                    return _path(path)
+
+            if t.__dict__.get("__recursive__", True):
+                key = (id(t), id(x))
+                if key in terms:
+                    if path is not None:
+                        guards.low = -1
+                        return _path(path)
+                else:
+                    terms.add(key)
+                    stack.append((None, _EXIT, key))
+
+            pending = []
+            for attr, types, values, keys in groups:
+                if attr.__class__ is tuple:
+                    failed = _items(t, path, attr, types, values, pending)
+                    if failed is not None:
+                        return _path(failed)
+                    continue
+                accepted = _accepted(t, types, attr)
+                classes = accepted.classes
+                for y in values:
+                    if type(y) not in classes:
+                        break
+                else:
+                    continue
+                pairs = enumerate(values) if keys is None else zip(keys, values)
+                for k, y in pairs:
+                    if type(y) in classes:
+                        continue
+                    if accepted.walks:
+                        pending.append(((path, k), y, accepted))
+                    elif accepted.learn(y):
+                        classes = accepted.classes
+                    else:
+                        return _path((path, k))
+            pending.reverse()
+            stack.extend(pending)
+        return None
+    finally:
+        for _, x, key in stack:
+            if x is _EXIT:
+                terms.discard(key)
+
+def _items(t, path, attrs, types, items, pending):
+    """
+    Check the (key, value) pairs 'items' of a mapping in a
+    single pass, with the keys against the first of 'types'
+    and the values against the second. Walked elements are
+    pushed to 'pending'. Returns the path to the first key
+    or value failing by itself, else None.
+    """
+    checks = [(i, _accepted(t, ts, attr)) for i, (attr, ts) in enumerate(zip(attrs, types))]
+    for pair in items:
+        for i, accepted in checks:
+            y = pair[i]
+            if type(y) in accepted.classes:
+                continue
+            if accepted.walks:
+                pending.append(((path, pair[0]), y, accepted))
+            elif not accepted.learn(y):
+                return (path, pair[0])
+    return None
+
+def _resolve(x, accepted):
+    """
+    Check the node 'x' against the alternatives of 'accepted'.
+    Returns True if some alternative which is not walked
+    accepts it, the walked alternative and the groups to walk
+    if it is the only one left, and None if none accepts it.
+    """
+    walks = []
+    for t, walk in zip(accepted.types, accepted.walkers):
+        if walk is None:
+            if _checker(t)(x):
+                if _by_class(t):
+                    accepted.classes = accepted.classes | {type(x)}
+                return True
+        else:
+            groups = walk(t, x)
+            if groups is not None:
+                walks.append((t, groups))
+    if len(walks) == 1:
+        return walks[0]
+    if any(_checker(t)(x) for t, _ in walks):
+        return True
+    return None
+
+def _path(path):
+    keys = []
+    while path is not None:
+        path, k = path
+        keys.append(k)
+    keys.reverse()
+    return keys
+
+_SCAN = 4
+
+def _sample(typ, trm, indexed=False):
+    """
+    The elements of the container 'trm' to be checked
+    against 'typ': all of them, or, when a sampling size
+    applies, the first half of it and a seeded random draw
+    of the rest. Sequences draw from all their elements
+    and always keep the last one, while sets and dicts
+    only scan a bounded prefix of 'trm'. If 'indexed', the
+    positions of the elements, or None if all of them are
+    checked, come along with them.
+
+    The size set for the running function takes precedence
+    over the '__sample__' of 'typ' and over 'config.sample'.
+    No sampling applies to deep checks.
+    """
+    size = STATEFUL.SAMPLE.get() if STATEFUL.DEPTH.get() < 3 else 0
+    if size is None:
+        size = getattr(typ, "__dict__", {}).get("__sample__")
+    if size is None:
+        size = config.sample
+    if not size:
+        return (None, trm) if indexed else trm
+    try:
+        n = len(trm)
+    except TypeError:
+        return (None, trm) if indexed else trm
+    if n <= size:
+        return (None, trm) if indexed else trm
+
+    from random import Random
+    head = size // 2
+    rand = Random(config.seed * 1000003 + n)
+    if STATEFUL.SAMPLED.get() is not None:
+        STATEFUL.SAMPLED.set(True)
+    if isinstance(trm, (list, tuple)):
+        picks = set(range(head))
+        picks.update(rand.sample(range(head, n - 1), size - head - 1))
+        picks.add(n - 1)
+        picks = sorted(picks)
+        elements = [trm[i] for i in picks]
+    else:
+        bound = min(n, _SCAN * size)
+        picks = sorted({*range(head), *rand.sample(range(head, bound), size - head)})
+        wanted = set(picks)
+        elements = [x for i, x in enumerate(islice(trm, bound)) if i in wanted]
+    return (picks, elements) if indexed else elements
+
+def _sampled():
+    """
+    The extra error fields telling that the
+    failed check only looked at a sample.
+    """
+    if STATEFUL.SAMPLED.get():
+        return {"sampled": True}
+    return {}
+
+_DEPTHS = {"off": 0, "shallow": 1, "standard": 2, "deep": 3}
+
+def _depth(level):
+    """
+    The depth of checks named by 'level'.
+    """
+    try:
+        return _DEPTHS[level]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unknown check level: {level!r}\n"
+            f"     [expected] one of {', '.join(map(repr, _DEPTHS))}"
+        ) from None
+
+_LOCK = Lock()
+
+def _off(step):
+    """
+    Count the running 'off' levels, dropping the callables of
+    typed functions when the first one starts, since these are
+    decided for checks which are never off.
+    """
+    with _LOCK:
+        STATEFUL.OFF += step
+        if step > 0 and STATEFUL.OFF == 1:
+            STATEFUL.__rebind__()
+
+def _shallow():
+    """
+    Check if the running checks look at the outer
+    class of containers only, not at their elements.
+    """
+    return STATEFUL.DEPTH.get() < 2
+
+def _intern(key, build):
+    """
+    Return the type interned under 'key', calling
+    'build' to create it on the first request.
+    """
+    try:
+        return STATEFUL.INTERNED[key]
+    except KeyError:
+        pass
+    return STATEFUL.INTERNED.setdefault(key, build())
+
+def _admits(typesystem, t):
+    """
+    Check if 't' is a member of 'typesystem' or
+    a type built inside it, as parametric types are.
+    """
+    if t in typesystem:
+        return True
+    return typesystem in getattr(t, "__dict__", {}).get("__typesystems__", ())
+
+def _recursive(*types):
+    """
+    Check if a term check against some of 'types'
+    may reenter itself and so needs the recursion guard.
+    """
+    for t in types:
+        if type(t) is type:
+            continue
+        if getattr(t, "__dict__", {}).get("__recursive__", True):
+            return True
+    return False
 
-            if hasattr(type(type(trm)), "__issub__"):
-                issub_func = getattr(type(type(trm)), "__issub__")
-                if issub_func is not STATEFUL.__issub__:
-                    try:
-                        res = issub_func(type(trm), typ)
-                        if res: return True
-                    except TypeError:
-                        pass
+def _pure(*types):
+    """
+    Check if the term checks against 'types' depend only
+    on the checked value, so that they can be memoized.
+    """
+    for t in types:
+        if type(t) is type:
+            continue
+        if not getattr(t, "__dict__", {}).get("__pure__", False):
+            return False
+    return True
+
+_SCALARS = frozenset((int, float, complex, bool, str, bytes, type(None)))
+
+def _frozen(x):
+    """
+    A key of the deeply immutable value 'x' which
+    tells apart equal values of distinct classes,
+    or None if 'x' may change after being checked.
+    """
+    cls = x.__class__
+    if cls in _SCALARS:
+        return (cls, x)
+    if cls is tuple or cls is frozenset:
+        keys = []
+        for e in x:
+            key = _frozen(e)
+            if key is None:
+                return None
+            keys.append(key)
+        return (cls, cls(keys))
+    return None
 
-            if isinstance(trm, type) and isinstance(typ, type):
-                if issubclass(trm, typ):
-                    return True
+class LRU:
+    """
+    The bounded memo of term checks of immutable
+    values against pure types, sized by 'config.memo'.
+    """
+    __slots__ = ("data", "hits", "misses")
 
-            return isinstance(trm, typ)
+    def __init__(self):
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def check(self, typ, key, trm):
+        data = self.data
+        entry = data.get((id(typ), key))
+        if entry is not None and entry[0] is typ:
+            self.hits += 1
+            try:
+                data.move_to_end((id(typ), key))
+            except KeyError:
+                pass
+            return entry[1]
+        self.misses += 1
+
+        guards = STATEFUL.GUARDS
+        low = guards.low
+        guards.low = float("inf")
+        try:
+            res = _checker(typ)(trm)
         finally:
-            STATEFUL.TERMS.remove(key)
+            mine = guards.low
+            guards.low = min(low, mine)
+        if mine == float("inf"):
+            data[(id(typ), key)] = (typ, res)
+            while len(data) > config.memo:
+                try:
+                    data.popitem(last=False)
+                except KeyError:
+                    break
+        return res
+
+    def clear(self):
+        self.data.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.data),
+            "maxsize": config.memo
+        }
+
+STATEFUL.TERMS = LRU()
+
+class REGISTRY:
+    """
+    The terms registered for a type, held by identity, so
+    unhashable terms are admitted. They are held weakly when
+    they can be weakly referenced. Otherwise, as for ints,
+    bytes and tuples, only the last 'config.strong' of them
+    are held, strongly, and none by default, so that terms
+    made in bulk are not kept alive by their registry.
+    """
+    __slots__ = ("weak", "strong")
+
+    def __init__(self):
+        self.weak = WeakValueDictionary()
+        self.strong = {}
+
+    def add(self, x):
+        try:
+            self.weak[id(x)] = x
+        except TypeError:
+            strong = self.strong
+            if config.strong:
+                strong[id(x)] = x
+            while len(strong) > config.strong:
+                del strong[next(iter(strong))]
+
+    def __contains__(self, x):
+        return self.weak.get(id(x)) is x or self.strong.get(id(x)) is x
+
+    def __iter__(self):
+        yield from list(self.weak.values())
+        yield from list(self.strong.values())
+
+    def __len__(self):
+        return len(self.weak) + len(self.strong)
+
+def _memoized(trm, types):
+    """
+    Check 'trm' against 'types' through the term memo,
+    which only holds the verdicts of standard checks made
+    with no sampling. Types with a sample of their own are
+    not pure, so they are never memoized either.
+    """
+    sampled = STATEFUL.SAMPLE.get() or config.sample
+    key = _frozen(trm) if STATEFUL.DEPTH.get() == 2 and not sampled else None
+    for t in types:
+        if key is not None and _pure(t):
+            res = STATEFUL.TERMS.check(t, key, trm)
+        else:
+            res = _checker(t)(trm)
+        if res:
+            return True
+    return False
+
+def _checker(typ):
+    """
+    Return the compiled term checker of 'typ',
+    building it on first use.
+    """
+    try:
+        return typ.__dict__["__checker__"]
+    except (AttributeError, KeyError, TypeError):
+        pass
+    try:
+        return STATEFUL.CHECKERS[typ]
+    except (KeyError, TypeError):
+        pass
+
+    chk = STATEFUL.__compile__(typ)
+    if isinstance(typ, type):
+        try:
+            type.__setattr__(typ, "__checker__", chk)
+        except TypeError:
+            STATEFUL.CHECKERS[typ] = chk
+    return chk
+
+def _unchecker(typ):
+    """
+    Drop the compiled term checker of 'typ', so that
+    it is rebuilt from its current hooks on next use.
+    """
+    if "__checker__" in getattr(typ, "__dict__", {}):
+        type.__delattr__(typ, "__checker__")
+    STATEFUL.CHECKERS.pop(typ, None)
 
 class MAGIC:
     def __in__(typ, trm):
@@ -750,6 +1514,8 @@ class Placeholder:
 
         return method_caller
 
+_ = Placeholder(0)
+
 class Var:
     def __init__(self):
         self._placeholder_cache = {}
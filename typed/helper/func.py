@@ -1,5 +1,9 @@
-from functools import lru_cache
+from functools import lru_cache, partial
+from random import Random
+from types import FunctionType
 from typed.mods.err import Err, TypeErr, HintErr, DomErr, CodErr
+from typed.mods.config import config
+from typed.helper.core import STATEFUL, ACCEPTED, Placeholder, _Placeholder, _alternatives, _by_class, _checker
 
 @lru_cache(maxsize=512)
 def signature(func):
@@ -65,8 +69,8 @@ def _is_composable(*funcs, revert: bool = False) -> bool:
 
 def _runtime_domain(func):
     def wrapper(*args, **kwargs):
-        from typed.mods.types.base import TYPE
-        return tuple(TYPE(arg) for arg in args)
+        from typed.mods.core import typeof
+        return tuple(typeof(arg) for arg in args)
     return wrapper
 
 def _runtime_codomain(func):
@@ -121,23 +125,46 @@ def _hinted_codomain(func):
     from inspect import Signature
     return type_hints.get('return', Signature.empty)
 
-def _check_domain(func, paramnames, expected_domain, actual_domain, args, allow_subclass=True):
-    from typed.mods.core import type, isterm
+def _check_domain(func, paramnames, expected_domain, actual_domain, args, allow_subclass=True, sample=None):
+    from typed.helper.core import STATEFUL, _checker, _sampled
 
-    for p_name, expected_type, actual_value in zip(paramnames, expected_domain, args):
-        actual_type = type(actual_value)
-
-        # Replaced isinstance with framework isterm
-        if not isterm(actual_value, expected_type):
-            raise DomErr(term=func, arg=p_name, expected=expected_type, received=actual_type)
-        elif hasattr(expected_type, 'check') and not expected_type.check(actual_value):
-            raise DomErr(term=func, arg=p_name, expected=expected_type, received=actual_type)
+    sampled = STATEFUL.SAMPLED.set(False)
+    size = None
+    try:
+        if sample is not None:
+            size = STATEFUL.SAMPLE.set(sample)
+        for p_name, expected_type, actual_value in zip(paramnames, expected_domain, args):
+            if not _checker(expected_type)(actual_value):
+                from typed.mods.core import typeof as type
+                raise DomErr(term=func, arg=p_name, expected=expected_type, received=type(actual_value), **_sampled())
+            elif hasattr(expected_type, 'check') and not expected_type.check(actual_value):
+                from typed.mods.core import typeof as type
+                raise DomErr(term=func, arg=p_name, expected=expected_type, received=type(actual_value), **_sampled())
+    finally:
+        STATEFUL.SAMPLED.reset(sampled)
+        if size is not None:
+            STATEFUL.SAMPLE.reset(size)
 
     return True
 
-def _check_codomain(func, expected_codomain, actual_codomain, result, allow_subclass=True):
-    from typed.mods.core import type, isterm
+def _check_codomain(func, expected_codomain, actual_codomain, result, allow_subclass=True, sample=None):
+    from typed.helper.core import STATEFUL
+
+    sampled = STATEFUL.SAMPLED.set(False)
+    size = None
+    try:
+        if sample is not None:
+            size = STATEFUL.SAMPLE.set(sample)
+        return _check_result(func, expected_codomain, result)
+    finally:
+        STATEFUL.SAMPLED.reset(sampled)
+        if size is not None:
+            STATEFUL.SAMPLE.reset(size)
+
+def _check_result(func, expected_codomain, result):
+    from typed.mods.core import typeof as type
     from typed.mods.types.base import TYPE
+    from typed.helper.core import _checker, _sampled
 
     actual_type = type(result)
 
@@ -147,21 +174,376 @@ def _check_codomain(func, expected_codomain, actual_codomain, result, allow_subc
         expected_codomain._name__.startswith('Union')):
 
         union_types = expected_codomain.__types__
-        # Replaced isinstance with framework isterm
-        if any(isterm(result, t) for t in union_types):
+        if any(_checker(t)(result) for t in union_types):
             for t in union_types:
-                if isterm(result, t) and hasattr(t, 'check') and not t.check(result):
-                    raise CodErr(term=func, expected=t, received=actual_type)
+                if _checker(t)(result) and hasattr(t, 'check') and not t.check(result):
+                    raise CodErr(term=func, expected=t, received=actual_type, **_sampled())
             return True
-        raise CodErr(term=func, expected=expected_codomain, received=actual_type)
+        raise CodErr(term=func, expected=expected_codomain, received=actual_type, **_sampled())
 
-    if not isterm(result, expected_codomain):
-        raise CodErr(term=func, expected=expected_codomain, received=actual_type)
+    if not _checker(expected_codomain)(result):
+        raise CodErr(term=func, expected=expected_codomain, received=actual_type, **_sampled())
     elif hasattr(expected_codomain, 'check') and not expected_codomain.check(result):
-        raise CodErr(term=func, expected=expected_codomain, received=actual_type)
+        raise CodErr(term=func, expected=expected_codomain, received=actual_type, **_sampled())
 
     return True
 
+def _stream(typ, value):
+    """
+    Wrap 'value' in the lazily checking stream of 'typ',
+    if its metatype streams its terms.
+    """
+    stream = getattr(type(typ), "__stream__", None)
+    if stream is None:
+        return value
+    return stream(typ, value)
+
+def _exact(typ):
+    """
+    Check if the term check of 'typ' is all that the domain
+    and codomain checks do, with no 'check' method to call.
+    """
+    return not any(hasattr(t, "check") for t in (typ, *_alternatives((typ,))))
+
+def _checked(typ):
+    def check(x):
+        return _checker(typ)(x) and (not hasattr(typ, "check") or typ.check(x))
+    return check
+
+class INLINE:
+    """
+    The tuples of argument classes already proven to satisfy
+    the domain of a typed function, up to 'maxsize' of them.
+    """
+    __slots__ = ("keys", "maxsize")
+
+    def __init__(self, maxsize):
+        self.keys = set()
+        self.maxsize = maxsize
+
+    def learn(self, key):
+        if len(self.keys) < self.maxsize:
+            self.keys.add(key)
+
+    def stats(self):
+        return {
+            "size": len(self.keys),
+            "maxsize": self.maxsize
+        }
+
+class SAMPLER:
+    """
+    The calls of a typed function which are checked: one in
+    'every' of them, at an offset drawn from 'seed', and, if
+    'backoff' is set, only until 'backoff' consecutive calls
+    with the same classes of arguments passed their checks.
+    A call failing its checks starts the streak of its classes
+    over; errors raised by the function itself do not.
+    Streaks are kept for up to 'maxsize' tuples of classes.
+    """
+    __slots__ = ("every", "backoff", "seed", "maxsize", "offset", "calls", "streaks", "checked", "skipped")
+
+    def __init__(self, every, backoff, seed, maxsize):
+        self.every = every
+        self.backoff = backoff
+        self.seed = seed
+        self.maxsize = maxsize
+        self.offset = Random(seed).randrange(every) if every > 1 else 0
+        self.calls = 0
+        self.streaks = {}
+        self.checked = 0
+        self.skipped = 0
+
+    def check(self, key):
+        self.calls += 1
+        if (
+            (self.every > 1 and self.calls % self.every != self.offset)
+            or (key is not None and self.streaks.get(key, 0) >= self.backoff)
+        ):
+            self.skipped += 1
+            return False
+        self.checked += 1
+        return True
+
+    def passed(self, key):
+        if key is None:
+            return
+        streak = self.streaks.get(key)
+        if streak is not None:
+            self.streaks[key] = streak + 1
+        elif len(self.streaks) < self.maxsize:
+            self.streaks[key] = 1
+
+    def failed(self, key):
+        self.streaks.pop(key, None)
+
+    def stats(self):
+        return {
+            "checked": self.checked,
+            "skipped": self.skipped,
+            "signatures": len(self.streaks)
+        }
+
+def _sampler(obj):
+    """
+    The sampler of the calls of the typed function 'obj',
+    from its own 'every' and 'backoff' or from the config,
+    or None if every call is to be checked.
+    """
+    every = obj.every if obj.every is not None else config.every
+    backoff = obj.backoff if obj.backoff is not None else config.backoff
+    if every <= 1 and not backoff:
+        return None
+    sampler = obj.__dict__.get("__sampler__")
+    if sampler is None or (sampler.every, sampler.backoff, sampler.seed, sampler.maxsize) != (every, backoff, config.seed, config.streaks):
+        sampler = obj.__dict__["__sampler__"] = SAMPLER(every, backoff, config.seed, config.streaks)
+    return sampler
+
+def _sampling(obj, call, *args, **kwargs):
+    """
+    Call the typed function 'obj' through 'call', which checks
+    it, or straight through its function if its sampler skips
+    the call. Calls with placeholders are never skipped.
+    """
+    sampler = _sampler(obj)
+    if sampler is None:
+        return call(obj, *args, **kwargs)
+    holders = (Placeholder, _Placeholder)
+    if any(type(x) in holders for x in args) or any(type(x) in holders for x in kwargs.values()):
+        return call(obj, *args, **kwargs)
+    key = None
+    if sampler.backoff:
+        key = (*map(type, args), *kwargs, *map(type, kwargs.values()))
+    if not sampler.check(key):
+        func = obj.func
+        return getattr(func, "__unchecked__", func)(*args, **kwargs)
+    try:
+        result = call(obj, *args, **kwargs)
+    except (DomErr, CodErr, TypeErr):
+        sampler.failed(key)
+        raise
+    sampler.passed(key)
+    return result
+
+def _compile_call(func, domain, codomain, slow):
+    """
+    Generate a wrapper of the function 'func' with the same
+    parameter list. It checks each named parameter against
+    its type in 'domain' and the result against 'codomain',
+    without binding the arguments.
+
+    Parameters whose types are decided by class alone are
+    checked together, once per tuple of argument classes,
+    and the tuples that passed are kept in an 'INLINE' cache.
+    They are not checked at all while the argument classes
+    are the same as in the last call. The other parameters
+    are checked on every call.
+
+    When a parameter fails, all the arguments are handed to
+    'slow', which reports the error. The same happens when
+    a placeholder is passed to a parameter whose type admits
+    it. Arguments and results of streamed types are wrapped
+    by the '__stream__' of their metatype.
+
+    Returns None if 'func' cannot be wrapped this way.
+    """
+    from inspect import Parameter
+    if not isinstance(func, FunctionType):
+        return None
+    try:
+        params = list(signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    if any(p.name.startswith("_typed_") for p in params):
+        return None
+
+    named = [p for p in params if p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)]
+    if domain is not None and len(named) != len(domain):
+        return None
+
+    head, args = [], []
+    for i, p in enumerate(params):
+        if p.kind is Parameter.POSITIONAL_ONLY:
+            head.append(p.name)
+            args.append(p.name)
+            if i + 1 == len(params) or params[i + 1].kind is not Parameter.POSITIONAL_ONLY:
+                head.append("/")
+        elif p.kind is Parameter.POSITIONAL_OR_KEYWORD:
+            head.append(p.name)
+            args.append(p.name)
+        elif p.kind is Parameter.VAR_POSITIONAL:
+            head.append(f"*{p.name}")
+            args.append(f"*{p.name}")
+        elif p.kind is Parameter.KEYWORD_ONLY:
+            if not any(q.kind is Parameter.VAR_POSITIONAL for q in params[:i]) and "*" not in head:
+                head.append("*")
+            head.append(p.name)
+            args.append(f"{p.name}={p.name}")
+        else:
+            head.append(f"**{p.name}")
+            args.append(f"**{p.name}")
+    head, args = ", ".join(head), ", ".join(args)
+
+    env = {"_typed_func": func, "_typed_slow": slow, "_typed_type": type, "_typed_holders": (Placeholder, _Placeholder)}
+    lines = [f"def _typed_call({head}):"]
+
+    cached, checked = [], []
+    for i, (p, t) in enumerate(zip(named, domain or ())):
+        holds = _checked(t)(Placeholder(0))
+        if _exact(t):
+            env[f"_typed_acc_{i}"] = acc = ACCEPTED((t,))
+            fails = f"_typed_type({p.name}) not in _typed_acc_{i}.classes and not _typed_acc_{i}.learn({p.name})"
+            if not holds and all(_by_class(a) for a in acc.types):
+                cached.append((p, fails))
+                continue
+        else:
+            env[f"_typed_chk_{i}"] = _checked(t)
+            fails = f"not _typed_chk_{i}({p.name})"
+        if holds:
+            fails = f"_typed_type({p.name}) in _typed_holders or {fails}"
+        checked.append((p, fails))
+
+    inline = None
+    if cached:
+        env["_typed_inline"] = inline = INLINE(config.inline)
+        env["_typed_keys"] = inline.keys
+        last = [f"_typed_c{i}" for i in range(len(cached))]
+        lines.append(f"    nonlocal {', '.join(last)}")
+        lines.append(f"    if {' or '.join(f'_typed_type({p.name}) is not {c}' for (p, _), c in zip(cached, last))}:")
+        lines.append(f"        _typed_key = ({''.join(f'_typed_type({p.name}), ' for p, _ in cached)})")
+        lines.append("        if _typed_key not in _typed_keys:")
+        for p, fails in cached:
+            lines.append(f"            if {fails}:")
+            lines.append(f"                return _typed_slow({args})")
+        lines.append("            _typed_inline.learn(_typed_key)")
+        lines.append(f"        {', '.join(last)}, = _typed_key")
+    for p, fails in checked:
+        lines.append(f"    if {fails}:")
+        lines.append(f"        return _typed_slow({args})")
+    for i, (p, t) in enumerate(zip(named, domain or ())):
+        stream = getattr(type(t), "__stream__", None)
+        if stream is not None:
+            env[f"_typed_stream_{i}"] = partial(stream, t)
+            lines.append(f"    {p.name} = _typed_stream_{i}({p.name})")
+
+    lines.append(f"    _typed_r = _typed_func({args})")
+    if codomain is not None:
+        env["_typed_cod"] = partial(_check_codomain, func, codomain, None)
+        if _exact(codomain):
+            env["_typed_acc_r"] = ACCEPTED((codomain,))
+            lines.append("    if _typed_type(_typed_r) not in _typed_acc_r.classes and not _typed_acc_r.learn(_typed_r):")
+            lines.append("        _typed_cod(_typed_r)")
+        else:
+            lines.append("    _typed_cod(_typed_r)")
+        stream = getattr(type(codomain), "__stream__", None)
+        if stream is not None:
+            env["_typed_stream_r"] = partial(stream, codomain)
+            lines.append("    _typed_r = _typed_stream_r(_typed_r)")
+    lines.append("    return _typed_r")
+
+    if inline is not None:
+        lines = [
+            "def _typed_make():",
+            f"    {' = '.join(last)} = None",
+            *(f"    {line}" for line in lines),
+            "    return _typed_call"
+        ]
+    exec("\n".join(lines), env)
+    call = env["_typed_make"]() if inline is not None else env["_typed_call"]
+    call.__name__ = func.__name__
+    call.__qualname__ = func.__qualname__
+    call.__defaults__ = func.__defaults__
+    call.__kwdefaults__ = func.__kwdefaults__
+    call.__wrapped__ = func
+    call.__inline__ = inline
+    return call
+
+def _compiled(obj, slow, domain=True, codomain=True):
+    """
+    The wrapper compiled for the typed function 'obj', checking
+    its domain and its codomain as asked, built again when the
+    typesystem changed since it was compiled, or 'slow' bound
+    to 'obj' if it cannot be compiled. While checks are off,
+    the function of 'obj' itself.
+    """
+    if not STATEFUL.DEPTH.get():
+        return getattr(obj.func, "__unchecked__", obj.func)
+    compiled = obj.__dict__.get("__compiled__")
+    if compiled is None or compiled[0] != STATEFUL.EPOCH:
+        bound = partial(slow, obj)
+        call = _compile_call(
+            obj.func,
+            obj.domain if domain else None,
+            obj.codomain if codomain else None,
+            bound
+        ) or bound
+        compiled = obj.__dict__["__compiled__"] = (STATEFUL.EPOCH, call)
+    return compiled[1]
+
+class HOT:
+    """
+    The callable a typed function is called through, decided
+    by the '__bind__' of its class on first access and kept
+    in its '__dict__', which then shadows this descriptor.
+    """
+    __slots__ = ()
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return _hot(obj, cls.__bind__)
+
+def _hot(obj, bind):
+    """
+    The callable the typed function 'obj' is called through:
+    the one 'bind' decides from its options and the config
+    while no check level is off, else one which looks at the
+    level on each call. It is kept in 'obj' until these, or
+    the typesystem, change.
+    """
+    if STATEFUL.OFF:
+        call = partial(_leveled, obj, bind)
+    else:
+        call = bind(obj)
+    obj.__dict__["__hot__"] = call
+    STATEFUL.HOT.add(obj)
+    return call
+
+def _leveled(obj, bind, *args, **kwargs):
+    if not STATEFUL.OFF:
+        return _hot(obj, bind)(*args, **kwargs)
+    if not STATEFUL.DEPTH.get():
+        func = obj.func
+        return getattr(func, "__unchecked__", func)(*args, **kwargs)
+    return bind(obj)(*args, **kwargs)
+
+def _inline(obj):
+    """
+    The occupancy of the inline cache of the wrapper compiled
+    for the typed function 'obj', or None if it has none.
+    """
+    compiled = obj.__dict__.get("__compiled__")
+    inline = getattr(compiled and compiled[1], "__inline__", None)
+    return None if inline is None else inline.stats()
+
+def _unchecked(func, cache=False):
+    """
+    The function 'func' itself, for when checking is disabled,
+    so that calling it costs nothing more than a plain call.
+    If 'cache', its memoized version instead, with the hinted
+    domain and codomain of 'func' attached if they resolve.
+    """
+    if not cache:
+        return func
+    wrapper = lru_cache(maxsize=None)(func)
+    try:
+        domain, codomain = tuple(_hinted_domain(func)), _hinted_codomain(func)
+    except Exception:
+        return wrapper
+    wrapper.domain = wrapper.dom = domain
+    wrapper.codomain = wrapper.cod = codomain
+    return wrapper
+
 def _check_defaults_match_hints(func):
     from inspect import Parameter
     sig = signature(func)
@@ -170,7 +552,7 @@ def _check_defaults_match_hints(func):
         if param.default is not Parameter.empty:
             hint = type_hints.get(p_name)
             if hint is not None:
-                from typed.mods.core import type, isterm
+                from typed.mods.core import typeof as type, isterm
                 if not isterm(param.default, hint):
                     raise TypeErr(term=func, arg=p_name, expected=hint, received=type(param.default), message="Default value does not match hint.")
 
@@ -187,7 +569,7 @@ def _instrument_locals_check(func, force_all_annotated=True):
             import inspect
             import ast
             from textwrap import dedent
-            from typed.mods.core import type, isterm
+            from typed.mods.core import typeof as type, isterm
 
             try:
                 lines, _ = inspect.getsourcelines(func)
@@ -276,11 +658,12 @@ def _instrument_locals_check(func, force_all_annotated=True):
         return instrumented_func(*args, **kwargs)
 
     wrapper.__wrapped__ = func
+    wrapper.__unchecked__ = func
     return wrapper
 
 def _variable_checker(typ):
     def wrapper(x):
-        from typed.mods.core import type, isterm
+        from typed.mods.core import typeof as type, isterm
         # Replaced isinstance with framework isterm
         if not isterm(x, typ):
             raise TypeErr(term=typ, arg=None, expected=typ, received=type(x), message="Mismatch type in variable value.")
@@ -290,7 +673,7 @@ def _variable_checker(typ):
 def _get_dom_cod(func_obj):
     from typed.mods.types.base import TYPE
     from inspect import Signature
-    from typed.mods.core import type
+    from typed.mods.core import typeof as type
 
     if hasattr(func_obj, "dom") and hasattr(func_obj, "cod"):
         dom_val = func_obj.dom
@@ -519,6 +519,10 @@ def _attach_model_attrs(child_model, parent_models):
     }
 
 def _update_model_attr(cls, name, value):
+    from typed.helper.core import STATEFUL
+    STATEFUL.__reset__()
+    for ts in getattr(cls, '__typesystems__', []):
+        ts.subtypes = None
     current_kwargs = {}
     ordered_keys_list = list(getattr(cls, '_ordered_keys', []))
     req_attrs = getattr(cls, '_defined_required_attributes', {})
@@ -4,7 +4,8 @@ __imports__ = {
     "typed.mods.meta.base": [
         "EMPTY",
         "NILL", "INT", "BOOL", "STR", "FLOAT", "BYTES",
-        "TUPLE", "LIST", "SET", "DICT"
+        "TUPLE", "LIST", "SET", "DICT",
+        "ITERATOR", "ITERABLE"
         ]
 
 }
@@ -13,7 +14,8 @@ if lazy(__imports__):
     from typed.mods.meta.base import (
         EMPTY,    
         NILL, ANY, INT, BOOL, STR, FLOAT, BYTES,
-        TUPLE, LIST, SET, DICT
+        TUPLE, LIST, SET, DICT,
+        ITERATOR, ITERABLE
     )
 
 #     from typed.mods.meta.func import (
@@ -1,6 +1,23 @@
+from os import environ
+
 class Config:
-    enabled: bool = True
+    enabled: bool = environ.get("TYPED_ENABLED", "1").strip().lower() not in ("0", "false", "no", "off")
     strict:  bool = False
     debug:   bool = False
+    index:   bool = False
+    terms:   bool = True
+    sample:  int  = 0
+    seed:    int  = 0
+    memo:    int  = 0
+    inline:  int  = 8
+    every:   int  = 0
+    backoff: int  = 0
+    streaks: int  = 64
+    strong:  int  = 0
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        from typed.helper.core import STATEFUL
+        STATEFUL.__rebind__()
 
 config = Config()
@@ -0,0 +1,231 @@
+from functools import wraps
+from typed.mods.core import issub, name
+from typed.helper.core import STATEFUL, _accepted
+
+def _element(typ, types, attr="__accepted__"):
+    """
+    The element check of the parametric type 'typ',
+    or None if its elements are not constrained.
+    """
+    if not types:
+        return None
+    accepted = _accepted(typ, types, attr)
+    def check(x):
+        return x.__class__ in accepted.classes or accepted.learn(x)
+    return check
+
+def _deep(checked):
+    """
+    Run the element checks of 'checked' at the deep level,
+    whatever the running one, so that the stamp of a typed
+    container always stands for elements checked in full.
+    """
+    @wraps(checked)
+    def __checked__(self, *args, **kwargs):
+        token = STATEFUL.DEPTH.set(3)
+        try:
+            return checked(self, *args, **kwargs)
+        finally:
+            STATEFUL.DEPTH.reset(token)
+    return __checked__
+
+def _bound(typ, meta):
+    if not any(m is meta for m in getattr(type(typ), "__mro__", ())):
+        raise TypeError(f"Type {typ} is not a {meta.__display__} type")
+    return typ
+
+def _stamped(trm, typ):
+    """
+    Check if the container 'trm' was validated for 'typ'.
+    """
+    stamp = trm.__validated__
+    return stamp is typ or issub(stamp, typ)
+
+def _reject(typ, x, what="element"):
+    raise TypeError(f"The {what} {x!r} is not a term of the type arguments of {name(typ)}")
+
+
+class TypedList(list):
+    """
+    A list validated once against a parametric 'List' type.
+    Only the delta is checked on mutation, so the metatype
+    'LIST' accepts it in O(1) through its stamp.
+
+    >>> xs = TypedList(List(Int), [1, 2])
+    >>> xs.append(3)
+    """
+    __slots__ = ("__validated__",)
+
+    def __init__(self, typ, iterable=()):
+        from typed.mods.meta.base import LIST
+        self.__validated__ = _bound(typ, LIST)
+        super().__init__(self.__checked__(iterable))
+
+    @_deep
+    def __checked__(self, iterable):
+        typ = self.__validated__
+        check = _element(typ, getattr(typ, "__types__", None))
+        items = list(iterable)
+        if check is not None:
+            for x in items:
+                if not check(x):
+                    _reject(typ, x)
+        return items
+
+    def append(self, x):
+        super().append(*self.__checked__((x,)))
+
+    def insert(self, i, x):
+        super().insert(i, *self.__checked__((x,)))
+
+    def extend(self, iterable):
+        super().extend(self.__checked__(iterable))
+
+    def __iadd__(self, iterable):
+        return super().__iadd__(self.__checked__(iterable))
+
+    def __setitem__(self, i, x):
+        if isinstance(i, slice):
+            super().__setitem__(i, self.__checked__(x))
+        else:
+            super().__setitem__(i, *self.__checked__((x,)))
+
+    def __repr__(self):
+        return f"TypedList({name(self.__validated__)}, {list.__repr__(self)})"
+
+
+class TypedSet(set):
+    """
+    A set validated once against a parametric 'Set' type.
+    Only the delta is checked on mutation, so the metatype
+    'SET' accepts it in O(1) through its stamp.
+    """
+    __slots__ = ("__validated__",)
+
+    def __init__(self, typ, iterable=()):
+        from typed.mods.meta.base import SET
+        self.__validated__ = _bound(typ, SET)
+        super().__init__(self.__checked__(iterable))
+
+    @_deep
+    def __checked__(self, iterable):
+        typ = self.__validated__
+        check = _element(typ, getattr(typ, "__types__", None))
+        items = list(iterable)
+        if check is not None:
+            for x in items:
+                if not check(x):
+                    _reject(typ, x)
+        return items
+
+    def add(self, x):
+        super().add(*self.__checked__((x,)))
+
+    def update(self, *others):
+        super().update(*(self.__checked__(o) for o in others))
+
+    def symmetric_difference_update(self, other):
+        super().symmetric_difference_update(self.__checked__(other))
+
+    def __ior__(self, other):
+        return super().__ior__(set(self.__checked__(other)))
+
+    def __ixor__(self, other):
+        return super().__ixor__(set(self.__checked__(other)))
+
+    def __repr__(self):
+        return f"TypedSet({name(self.__validated__)}, {set(self)!r})"
+
+
+class TypedDict(dict):
+    """
+    A dict validated once against a parametric 'Dict' type.
+    Only the delta is checked on mutation, so the metatype
+    'DICT' accepts it in O(1) through its stamp.
+    """
+    __slots__ = ("__validated__",)
+
+    def __init__(self, typ, *args, **kwargs):
+        from typed.mods.meta.base import DICT
+        self.__validated__ = _bound(typ, DICT)
+        super().__init__(self.__checked__(*args, **kwargs))
+
+    @_deep
+    def __checked__(self, *args, **kwargs):
+        typ = self.__validated__
+        key_type = getattr(typ, "__key_type__", None)
+        values = _element(typ, getattr(typ, "__types__", None))
+        keys = _element(typ, (key_type,) if key_type is not None else None, "__accepted_keys__")
+        items = dict(*args, **kwargs)
+        for k, v in items.items():
+            if keys is not None and not keys(k):
+                _reject(typ, k, "key")
+            if values is not None and not values(v):
+                _reject(typ, v, "value")
+        return items
+
+    def __setitem__(self, k, v):
+        self.__checked__(((k, v),))
+        super().__setitem__(k, v)
+
+    def update(self, *args, **kwargs):
+        super().update(self.__checked__(*args, **kwargs))
+
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return self[k]
+
+    def __ior__(self, other):
+        return super().__ior__(self.__checked__(other))
+
+    def __repr__(self):
+        return f"TypedDict({name(self.__validated__)}, {dict.__repr__(self)})"
+
+
+class TypedIterator:
+    """
+    An iterator whose elements are checked against a
+    parametric 'Iterator' or 'Iterable' type as they
+    are consumed, so that nothing is materialized.
+
+    >>> xs = TypedIterator(Iterator(Int), iter([1, 2]))
+    >>> next(xs)
+    """
+    __slots__ = ("__validated__", "__source__", "__check__")
+
+    def __init__(self, typ, iterable):
+        self.__validated__ = typ
+        self.__source__ = iter(iterable)
+        self.__check__ = _element(typ, getattr(typ, "__types__", None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        x = next(self.__source__)
+        check = self.__check__
+        if check is not None and not check(x):
+            _reject(self.__validated__, x)
+        return x
+
+    def __repr__(self):
+        return f"TypedIterator({name(self.__validated__)}, {self.__source__!r})"
+
+
+class TypedIterable:
+    """
+    An iterable whose every iteration is a 'TypedIterator'
+    over a fresh iterator of the wrapped iterable.
+    """
+    __slots__ = ("__validated__", "__source__")
+
+    def __init__(self, typ, iterable):
+        self.__validated__ = typ
+        self.__source__ = iterable
+
+    def __iter__(self):
+        return TypedIterator(self.__validated__, self.__source__)
+
+    def __repr__(self):
+        return f"TypedIterable({name(self.__validated__)}, {self.__source__!r})"
@@ -1,3 +1,8 @@
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
+from typed.mods.config import config
+from typed.helper.core import STATEFUL, REGISTRY, _checker, _memoized, _walk, _depth, _off
+
 def null(t):
     """
     The 'null' polymorphism.
@@ -20,17 +25,43 @@ def builtin(t):
     return getattr(t, "__builtin__", NotDefined)
 
 def track(t):
+    """
+    The tracked subclass of a builtin class, built once per
+    class and then reused: weakly referable when the class
+    admits it, with the lightest layout that does. Returns
+    NotDefined if the class cannot be subclassed.
+    """
     from typed.mods.err import NotDefined
-    if builtin(t) is not NotDefined:
-        name = f"Track({name(t)})"
+    if not isinstance(t, type):
+        return NotDefined
+    try:
+        return STATEFUL.TRACKS[t]
+    except KeyError:
+        pass
+
+    display_name = f"Track({name(t)})"
+    fallback = NotDefined
+    for slots in (("__weakref__",), (), None):
         attrs = {
-            "__display__": name,
+            "__display__": display_name,
             "is_track": True,
             "__builtin__": t
         }
-        return type.__call__(name, (t,), attrs)
-
-    return NotDefined
+        if slots is not None:
+            attrs["__slots__"] = slots
+        try:
+            tracked = type(display_name, (t,), attrs)
+        except TypeError:
+            continue
+        if tracked.__weakrefoffset__:
+            STATEFUL.TRACKS[t] = tracked
+            return tracked
+        if fallback is NotDefined:
+            fallback = tracked
+
+    if fallback is not NotDefined:
+        STATEFUL.TRACKS[t] = fallback
+    return fallback
 
 def terms(t):
     """
@@ -39,9 +70,49 @@ def terms(t):
     from typed.mods.err import NotDefined
     __terms__ = getattr(t, "__terms__", NotDefined)
     if __terms__ is not NotDefined:
-        return set(__terms__)
+        return list(__terms__)
     return
 
+def mismatch(trm, typ):
+    """
+    The path of keys and indexes to the first node of
+    'trm' which fails 'typ', or None if 'trm' is a term.
+    """
+    if getattr(type(typ), "__walk__", None) is None:
+        return None if isterm(trm, typ) else []
+    return _walk(typ, trm)
+
+def memo():
+    """
+    The hit and miss stats of the term memo.
+    """
+    return STATEFUL.TERMS.stats()
+
+@contextmanager
+def checks(level):
+    """
+    Run the enclosed checks at the given level: 'off' to skip
+    the checks of typed functions, 'shallow' to check the outer
+    class of containers only, 'standard', or 'deep' to check
+    every element, with no sampling. The level holds for the
+    running context only, so for the running thread or task.
+
+    Direct 'isterm' calls are never skipped: under 'off' they
+    check the outer class of containers, as under 'shallow'.
+    The elements given to typed containers are always checked
+    in full, since their stamp is trusted afterwards.
+    """
+    depth = _depth(level)
+    token = STATEFUL.DEPTH.set(depth)
+    if not depth:
+        _off(1)
+    try:
+        yield
+    finally:
+        STATEFUL.DEPTH.reset(token)
+        if not depth:
+            _off(-1)
+
 def names(*terms):
     return ', '.join(name(t) for t in terms)
 
@@ -54,37 +125,40 @@ def extends(typ, *others):
     return False
 
 def issup(typ, *others):
-    from typed.helper.core import STATEFUL
     for other in others:
         if STATEFUL.__issup__(typ, other):
             return True
     return False
 
 def issub(typ, *others):
-    from typed.helper.core import STATEFUL
     for other in others:
         if STATEFUL.__issub__(typ, other):
             return True
     return False
 
 def isterm(trm, *types):
-    from typed.helper.core import STATEFUL
+    if config.memo:
+        return _memoized(trm, types)
     for t in types:
-        if STATEFUL.__isterm__(t, trm):
+        try:
+            check = t.__dict__["__checker__"]
+        except (AttributeError, KeyError, TypeError):
+            check = _checker(t)
+        if check(trm):
             return True
     return False
 
 class ___UNIVERSE___(type):
     def __new__(mcls, name, bases, dct, **kwds):
         cls = super().__new__(mcls, name, bases, dct, **kwds)
+        if not config.terms:
+            return cls
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            cls.__terms__ = WeakSet()
+            cls.__terms__ = REGISTRY()
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            mcls.__terms__ = WeakSet()
+            mcls.__terms__ = REGISTRY()
 
         try:
             mcls.__terms__.add(cls)
@@ -102,14 +176,14 @@ class ___UNIVERSE___(type):
 class ___ABSTRACT___(___UNIVERSE___):
     def __new__(mcls, name, bases, dct, **kwds):
         cls = super().__new__(mcls, name, bases, dct, **kwds)
+        if not config.terms:
+            return cls
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            cls.__terms__ = WeakSet()
+            cls.__terms__ = REGISTRY()
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            mcls.__terms__ = WeakSet()
+            mcls.__terms__ = REGISTRY()
 
         try:
             mcls.__terms__.add(cls)
@@ -127,14 +201,14 @@ class ___ABSTRACT___(___UNIVERSE___):
 class __UNIVERSE__(type, metaclass=___UNIVERSE___):
     def __new__(mcls, name, bases, dct, **kwds):
         cls = super().__new__(mcls, name, bases, dct, **kwds)
+        if not config.terms:
+            return cls
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            cls.__terms__ = WeakSet()
+            cls.__terms__ = REGISTRY()
 
         if "__terms__" not in mcls.__dict__:
-            from weakref import WeakSet
-            mcls.__terms__ = WeakSet()
+            mcls.__terms__ = REGISTRY()
 
         try:
             mcls.__terms__.add(cls)
@@ -206,6 +280,146 @@ class __ABSTRACT__(__UNIVERSE__, metaclass=___ABSTRACT___):
         return super().__call__(*args, **kwargs)
 
 
+def _flag(t, attr):
+    """
+    Read a flag as defined along the MRO of 't',
+    ignoring the attributes of its metatype.
+    """
+    for c in getattr(t, "__mro__", (t,)):
+        d = getattr(c, "__dict__", {})
+        if attr in d:
+            return d[attr]
+    return False
+
+class __TYPEMAP__(dict):
+    """
+    The mapping from builtin classes to types of a typesystem.
+    Lookups walk the MRO and are cached per class, weakly,
+    until the mapping changes, which also drops the verdicts
+    memoized from it, as the dispatch tables of the metatypes.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.resolved = WeakKeyDictionary()
+        self.loaded = False
+
+    def resolve(self, cls):
+        from typed.mods.err import NotDefined
+        if not isinstance(cls, type):
+            try:
+                return self.get(cls, NotDefined)
+            except TypeError:
+                return NotDefined
+        try:
+            return self.resolved[cls]
+        except KeyError:
+            pass
+
+        res = NotDefined
+        for base in cls.__mro__:
+            if base in self:
+                res = self[base]
+                break
+        self.resolved[cls] = res
+        return res
+
+    def __changed__(self):
+        self.resolved.clear()
+        STATEFUL.__reset__()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.__changed__()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.__changed__()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.__changed__()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        res = super().setdefault(key, default)
+        self.__changed__()
+        return res
+
+    def pop(self, *args):
+        res = super().pop(*args)
+        self.__changed__()
+        return res
+
+    def popitem(self):
+        res = super().popitem()
+        self.__changed__()
+        return res
+
+    def clear(self):
+        super().clear()
+        self.__changed__()
+
+class __INDEX__:
+    """
+    The subtyping relation among the members of a
+    typesystem, stored as one bitset of supertypes
+    for each member.
+    """
+    def __init__(self):
+        self.pos  = {}
+        self.refs = []
+        self.sups = []
+        self.free = []
+
+    def add(self, t):
+        if id(t) in self.pos:
+            return
+        row, subs = 0, 0
+        for q, m in enumerate(self.refs):
+            if m is None:
+                continue
+            if issub(t, m):
+                row |= self.sups[q]
+            if issub(m, t):
+                subs |= 1 << q
+
+        p = self.free.pop() if self.free else len(self.refs)
+        if p == len(self.refs):
+            self.refs.append(None)
+            self.sups.append(0)
+        row |= 1 << p
+        self.refs[p] = t
+        self.sups[p] = row
+        self.pos[id(t)] = p
+
+        q = 0
+        while subs:
+            if subs & 1:
+                self.sups[q] |= row
+            subs >>= 1
+            q += 1
+
+    def rm(self, t):
+        p = self.pos.pop(id(t), None)
+        if p is None:
+            return
+        self.refs[p] = None
+        self.sups[p] = 0
+        mask = ~(1 << p)
+        for q, row in enumerate(self.sups):
+            self.sups[q] = row & mask
+        self.free.append(p)
+
+    def issub(self, typ, other):
+        p = self.pos.get(id(typ))
+        if p is None:
+            return None
+        q = self.pos.get(id(other))
+        if q is None:
+            return None
+        return self.sups[p] & (1 << q) != 0
+
 class __TYPESYSTEM__:
     def __init__(
         self,
@@ -246,9 +460,11 @@ class __TYPESYSTEM__:
             "meta": set(),
             "type": set()
         }
+        self.__kinds__ = {}
+        self.subtypes = None
 
-        if typemap is None:
-            typemap = {}
+        if not isinstance(typemap, __TYPEMAP__):
+            typemap = __TYPEMAP__(typemap or {})
 
         self.universe = new.universe(
             name=universe,
@@ -268,6 +484,7 @@ class __TYPESYSTEM__:
         self.universe.__type__ = type
 
         self.__members__["universe"][-1] = self.universe
+        self.__kinds__[id(self.universe)] = "universe"
 
         def root_term(typ, trm):
             return "is_abstract" in getattr(trm, "__dict__", {})
@@ -296,6 +513,7 @@ class __TYPESYSTEM__:
         self.abstract.__type__ = type
 
         self.__members__["abstract"][-1] = self.abstract
+        self.__kinds__[id(self.abstract)] = "abstract"
 
         def sub_fn(univ, other):
             if "is_universe" in getattr(other, "__dict__", {}) and "is_universe" in getattr(univ, "__dict__", {}):
@@ -309,13 +527,13 @@ class __TYPESYSTEM__:
 
         def __new__(univ, typ, bases, namespace, **kwds):
             cls = type.__new__(univ, typ, bases, namespace, **kwds)
+            if not config.terms:
+                return cls
 
             if "__terms__" not in cls.__dict__:
-                from weakref import WeakSet
-                cls.__terms__ = WeakSet()
+                cls.__terms__ = REGISTRY()
             if "__terms__" not in univ.__dict__:
-                from weakref import WeakSet
-                univ.__terms__ = WeakSet()
+                univ.__terms__ = REGISTRY()
             try:
                 univ.__terms__.add(cls)
             except AttributeError:
@@ -374,10 +592,13 @@ class __TYPESYSTEM__:
                 if hasattr(self.abstract, "__terms__"):
                     self.abstract.__terms__.add(abs_cls)
 
+                from typed.helper.core import _unchecker
                 if prev is not None:
                     prev.__class__ = univ_cls
+                    _unchecker(prev)
                 if prev_abs is not None:
                     prev_abs.__class__ = univ_cls
+                    _unchecker(prev_abs)
 
                 prev = univ_cls
                 prev_abs = abs_cls
@@ -394,37 +615,57 @@ class __TYPESYSTEM__:
 
             if u_level not in self.__members__["universe"]:
                 self.__members__["universe"][u_level] = u
+                self.__kinds__[id(u)] = "universe"
             if u_level not in self.__members__["abstract"]:
-                self.__members__["abstract"][u_level] = a 
+                self.__members__["abstract"][u_level] = a
+                self.__kinds__[id(a)] = "abstract" 
 
     def add(self, *T):
+        STATEFUL.__reset__()
         for t in T:
             systems = getattr(t, '__typesystems__', [])
             sys_single = getattr(t, '__typesystem__', None)
             if self in systems or self is sys_single:
-                if getattr(t, 'is_type', False):
+                if _flag(t, 'is_type'):
                     self.__members__["type"].add(t)
-                if getattr(t, 'is_meta', False):
+                    self.__kinds__[id(t)] = "type"
+                if _flag(t, 'is_meta'):
                     self.__members__["meta"].add(t)
+                    self.__kinds__[id(t)] = "meta"
+                if self.subtypes is not None:
+                    self.subtypes.add(t)
 
     def rm(self, *T):
+        STATEFUL.__reset__()
         for t in T:
-            if t in self.__members__["type"]:
-                self.__members__["type"].remove(t)
-            if t in self.__members__["meta"]:
-                self.__members__["meta"].remove(t)
+            if self.__kinds__.get(id(t)) in ("type", "meta"):
+                del self.__kinds__[id(t)]
+                self.__members__["type"].discard(t)
+                self.__members__["meta"].discard(t)
+            if self.subtypes is not None:
+                self.subtypes.rm(t)
 
     def prune(self):
+        STATEFUL.__reset__()
+        for t in (*self.__members__["type"], *self.__members__["meta"]):
+            self.__kinds__.pop(id(t), None)
         self.__members__["type"].clear()
         self.__members__["meta"].clear()
+        self.subtypes = None
+
+    def index(self):
+        """
+        The bitset index of subtyping among the
+        metas and types, built on first use.
+        """
+        if self.subtypes is None:
+            self.subtypes = __INDEX__()
+            for t in (*self.__members__["meta"], *self.__members__["type"]):
+                self.subtypes.add(t)
+        return self.subtypes
 
     def __contains__(self, X):
-        return (
-            X in self.__members__["type"] or
-            X in self.__members__["meta"] or
-            X in self.__members__["abstract"].values() or
-            X in self.__members__["universe"].values()
-        )
+        return id(X) in self.__kinds__
 
     def __iter__(self):
         yield from self.__members__["universe"].values()
@@ -550,7 +791,7 @@ class new:
         if typesystem is None:
             typesystem = TYPESYSTEM
         for sup in sups:
-            if sup not in typesystem.__members__["meta"]:
+            if typesystem.__kinds__.get(id(sup)) != "meta":
                 raise TypeError(f"sup {sup} not in typesystem.__members__['meta']")
 
         typesystem.enrich(0)
@@ -570,13 +811,13 @@ class new:
     def type(name, meta, sups=(), attrs={}, typesystem=None):
         if typesystem is None:
             typesystem = TYPESYSTEM
-        if meta not in typesystem.__members__["meta"]:
+        if typesystem.__kinds__.get(id(meta)) != "meta":
             raise TypeError(f"meta {meta} not in typesystem.__members__['meta']")
 
         for s in sups:
-            if s not in typesystem.__members__["type"]:
+            if typesystem.__kinds__.get(id(s)) != "type":
                 raise TypeError(f"sup {s} not in typesystem.__members__['type']")
-            if type(s, typesystem) not in typesystem.__members__["meta"]:
+            if typesystem.__kinds__.get(id(type(s))) != "meta":
                 raise TypeError(f"type(s) not in typesystem.__members__['meta']")
 
         attrs["__display__"] = name
@@ -595,20 +836,24 @@ class new:
 TYPESYSTEM = new.typesystem()
 
 def __typemap__():
+    from types import FunctionType
     from typed.mods.types.base import (
         Int, Float, Bool, Str, Bytes,
         List, Tuple, Set, Dict
     )
-    TYPESYSTEM.typemap[int]       = Int
-    TYPESYSTEM.typemap[float]     = Float
-    TYPESYSTEM.typemap[bool]      = Bool
-    TYPESYSTEM.typemap[str]       = Str
-    TYPESYSTEM.typemap[bytes]     = Bytes
-    TYPESYSTEM.typemap[bytearray] = Bytes
-    TYPESYSTEM.typemap[list]      = List
-    TYPESYSTEM.typemap[tuple]     = Tuple
-    TYPESYSTEM.typemap[set]       = Set
-    TYPESYSTEM.typemap[dict]      = Dict
+    from typed.mods.types.func import Func
+    TYPESYSTEM.typemap.setdefault(int,       Int)
+    TYPESYSTEM.typemap.setdefault(float,     Float)
+    TYPESYSTEM.typemap.setdefault(bool,      Bool)
+    TYPESYSTEM.typemap.setdefault(str,       Str)
+    TYPESYSTEM.typemap.setdefault(bytes,     Bytes)
+    TYPESYSTEM.typemap.setdefault(bytearray, Bytes)
+    TYPESYSTEM.typemap.setdefault(list,      List)
+    TYPESYSTEM.typemap.setdefault(tuple,     Tuple)
+    TYPESYSTEM.typemap.setdefault(set,       Set)
+    TYPESYSTEM.typemap.setdefault(dict,      Dict)
+    TYPESYSTEM.typemap.setdefault(FunctionType, Func)
+    TYPESYSTEM.typemap.loaded = True
 
 def typemap(typ, typesystem=TYPESYSTEM):
     try:
@@ -617,30 +862,20 @@ def typemap(typ, typesystem=TYPESYSTEM):
     except TypeError:
         pass
 
-    if typesystem is TYPESYSTEM:
+    if not isinstance(typesystem.typemap, __TYPEMAP__):
+        typesystem.typemap = __TYPEMAP__(typesystem.typemap)
+    if typesystem is TYPESYSTEM and not TYPESYSTEM.typemap.loaded:
         __typemap__()
 
-    try:
-        if typ in typesystem.typemap:
-            return typesystem.typemap[typ]
-    except TypeError:
-        pass
-
-    from typed.mods.err import NotDefined
-    return NotDefined
+    return typesystem.typemap.resolve(typ)
 
 def typeof(t, typesystem=TYPESYSTEM):
     return typemap(type(t), typesystem)
 
 def kind(x, typesystem=TYPESYSTEM):
-    if any(x is a for a in typesystem.__members__["abstract"].values()):
-        return "abstract"
-    if any(x is u for u in typesystem.__members__["universe"].values()):
-        return "universe"
-    if x in typesystem.__members__["meta"]:
-        return "meta"
-    if x in typesystem.__members__["type"]:
-        return "type"
+    res = typesystem.__kinds__.get(id(x))
+    if res is not None:
+        return res
 
     from typed.mods.err import NotDefined
     return NotDefined
@@ -665,7 +900,6 @@ def name(t, typesystem=TYPESYSTEM):
     return getattr(t, '__name__', Anonymous.__name__)
 
 def term(value, type=None, typesystem=None):
-    from weakref import WeakSet
     from typed.mods.err import NotDefined, TypeErr
 
     if typesystem is None:
@@ -694,8 +928,8 @@ def term(value, type=None, typesystem=None):
     if tracked is not NotDefined:
         value = tracked(value)
 
-    if not hasattr(type, "__terms__"):
-        type.__terms__ = WeakSet()
+    if "__terms__" not in type.__dict__:
+        type.__terms__ = REGISTRY()
 
     type.__terms__.add(value)
 
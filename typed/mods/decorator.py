@@ -1,3 +1,9 @@
+from functools import lru_cache, update_wrapper
+from typed.mods.core import name as _name, typeof
+from typed.mods.types.base import TYPE
+from typed.mods.types.func import Func as Function
+from typed.helper.func import _check_defaults_match_hints, _instrument_locals_check
+
 def func(*args, **kwargs):
     from typed.mods.types.func import Func
 
@@ -12,10 +18,10 @@ def func(*args, **kwargs):
 
 def partial(func):
     def wrapper(*args, **kwargs):
-        from typed.mods.helper.general import _
+        from typed.helper.core import _
         underscore_to_check = _
         has_underscore = (
-            (underscore_to_check in args)
+            any(a is underscore_to_check for a in args)
             or any(v is underscore_to_check for v in kwargs.values())
         )
         if has_underscore:
@@ -38,6 +44,10 @@ def partial(func):
     return wrapper
 
 def hinted(func):
+    from typed.mods.config import config
+    if not config.enabled:
+        from typed.helper.func import _unchecked
+        return _unchecked(func)
     from typed.mods.types.func import Hinted
     return Hinted(func)
 
@@ -50,7 +60,11 @@ def typed(
     rigid=False,
     lazy=True,
     enclose=None,
+    message=None,
     partials=True,
+    sample=None,
+    every=None,
+    backoff=None,
 ):
     def _build_typed(res_func):
         from typed.mods.types.func import Lazy
@@ -84,34 +98,46 @@ def typed(
                 typed_func.__class__ = Condition
             else:
                 typed_func.__class__ = Typed
+            typed_func.sample = sample
+            typed_func.every = every
+            typed_func.backoff = backoff
 
             res_func = typed_func
         except Exception as e:
-            raise TypedErr(
+            raise TypeError(
                 f"Error in the typed function '{_name(res_func)}':\n {e}"
-            )
+            ) from e
 
-        if enclose is not None:
-            orig = res_func
+        return _enclose(res_func)
 
-            def _enclosed(*a, **kw):
-                try:
-                    return orig(*a, **kw)
-                except Exception as e:
-                    msg = message.format(e=e) if message is not None else str(e)
-                    raise enclose(msg) from e
+    def _enclose(res_func):
+        if enclose is None:
+            return res_func
 
-            update_wrapper(_enclosed, orig)
-            _enclosed.func = getattr(orig, "func", orig)
-            res_func = _enclosed
+        def _enclosed(*a, **kw):
+            try:
+                return res_func(*a, **kw)
+            except Exception as e:
+                msg = message.format(e=e) if message is not None else str(e)
+                raise enclose(msg) from e
 
-        return res_func
+        update_wrapper(_enclosed, res_func)
+        _enclosed.func = getattr(res_func, "func", res_func)
+        return _enclosed
 
     def _make_lazy_wrapper(func):
         from typed.mods.types.func import Lazy
-        return Lazy(func)
+        lazy_func = Lazy(func)
+        lazy_func.sample = sample
+        lazy_func.every = every
+        lazy_func.backoff = backoff
+        return lazy_func
 
     def typed_decorator(func):
+        from typed.mods.config import config
+        if not config.enabled:
+            from typed.helper.func import _unchecked
+            return _enclose(_unchecked(func, cache=cache))
         if not lazy:
             return _build_typed(func)
         return _make_lazy_wrapper(func)
@@ -136,11 +162,15 @@ def typed(
             "Wrong type in 'typed' decorator\n"
             f" ==> '{_name(arg)}': has an unexpected type\n"
             "     [expected_type] subtype of 'Function' or of 'TYPE'\n"
-            f"     [received_type] '{_name(TYPE(arg))}'"
+            f"     [received_type] '{_name(typeof(arg))}'"
         )
 
 
 def condition(func):
+    from typed.mods.config import config
+    if not config.enabled:
+        from typed.helper.func import _unchecked
+        return _unchecked(func)
     if isinstance(func, Function):
         from typed.mods.types.func import Condition
         if isinstance(func, Condition):
@@ -152,10 +182,14 @@ def condition(func):
         "Wrong type in 'condition' decorator\n"
         f" ==> '{func}': has an unexpected type\n"
          "     [expected_type] subtype of 'Function'\n"
-        f"     [received_type] '{_name(TYPE(func))}'"
+        f"     [received_type] '{_name(typeof(func))}'"
     )
 
 def factory(func):
+    from typed.mods.config import config
+    if not config.enabled:
+        from typed.helper.func import _unchecked
+        return _unchecked(func, cache=True)
     if isinstance(func, Function):
         from typed.mods.types.func import Typed
         typed_func = Typed(func)
@@ -183,7 +217,7 @@ def factory(func):
         "Wrong type in 'factory' decorator\n"
         f" ==> '{func}': has an unexpected type\n"
          "     [expected_type] subtype of 'Function'\n"
-        f"     [received_type] '{_name(TYPE(func))}'"
+        f"     [received_type] '{_name(typeof(func))}'"
     )
 
 def operation(func):
@@ -211,7 +245,7 @@ def operation(func):
         "Wrong type in 'operation' decorator\n"
         f" ==> '{_name(func)}': has an unexpected type\n"
          "     [expected_type] subtype of 'Function'\n"
-        f"     [received_type] '{_name(TYPE(func))}'"
+        f"     [received_type] '{_name(typeof(func))}'"
     )
 
 def dependent(func):
@@ -233,5 +267,5 @@ def dependent(func):
         "Wrong type in 'dependent' decorator\n"
         f" ==> '{_name(func)}': has an unexpected type\n"
          "     [expected_type] subtype of 'Function'\n"
-        f"     [received_type] '{_name(TYPE(func))}'"
+        f"     [received_type] '{_name(typeof(func))}'"
     )
@@ -85,6 +85,22 @@ class HintErr(Err):
         )
 
 
+class TypeSystemErr(Err):
+    def __init__(self, message="Type not admitted in the typesystem", typesystem=None, **kwargs):
+        if typesystem is None:
+            raise ValueError("Missing 'typesystem' in 'TypeSystemErr'.")
+
+        from typed.mods.core import name
+        typesystem = name(typesystem)
+
+        kwargs.setdefault("__multiline__", True)
+
+        super().__init__(
+            message=message,
+            typesystem=typesystem,
+            **kwargs
+        )
+
 class TypeErr(Err):
     def __init__(
         self,
@@ -102,7 +118,7 @@ class TypeErr(Err):
         if expected is None:
             raise ValueError("Missing 'expected' in 'TypeErr'")
 
-        from typed.mods.core import name, type
+        from typed.mods.core import name, typeof as type
 
         term_type = type(term)
         term_typesystems = getattr(term_type, "__typesystems__", [])
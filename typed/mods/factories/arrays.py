@@ -0,0 +1,168 @@
+from sys import modules
+from typed.mods.core import TYPESYSTEM, UNIVERSE
+from typed.mods.meta.base import TYPE
+from typed.mods.err import NotDefined
+from typed.helper.core import _intern
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The 'Array' factory requires 'numpy' to be installed.") from None
+    return numpy
+
+def _dims(shape, other):
+    return all(d is None or s == d for s, d in zip(shape, other))
+
+def _refines(shape, other):
+    """
+    Check if every shape matching the pattern 'shape' also
+    matches 'other', where 'None' stands for any size of a
+    dimension and '...' for any number of dimensions.
+    """
+    if other is None:
+        return True
+    if shape is None:
+        return False
+    if ... in other:
+        i = other.index(...)
+        head, tail = other[:i], other[i+1:]
+        if ... in shape:
+            j = shape.index(...)
+            if j < len(head) or len(shape) - j - 1 < len(tail):
+                return False
+        elif len(shape) < len(head) + len(tail):
+            return False
+        return _dims(shape[:len(head)], head) and _dims(shape[len(shape)-len(tail):], tail)
+    if ... in shape or len(shape) != len(other):
+        return False
+    return _dims(shape, other)
+
+def _shape(shape):
+    if shape is None:
+        return None
+    if isinstance(shape, int) or shape is ...:
+        shape = (shape,)
+    shape = tuple(shape)
+    for d in shape:
+        if not (d is None or d is ... or (isinstance(d, int) and not isinstance(d, bool) and d >= 0)):
+            raise TypeError(f"Wrong dimension '{d!r}' in Array shape: expected a size, None or '...'")
+    if shape.count(...) > 1:
+        raise TypeError("Array shape admits at most one '...'")
+    return shape
+
+def _dtype(np, dtype):
+    """
+    The dtype of an Array: abstract scalar kinds, as
+    'np.integer', are kept as classes and anything else is
+    normalized by 'np.dtype', so that 'int64' and 'np.int64'
+    give the same type.
+    """
+    abstract = (
+        np.generic, np.number, np.integer, np.signedinteger,
+        np.unsignedinteger, np.inexact, np.floating,
+        np.complexfloating, np.flexible, np.character
+    )
+    if dtype in abstract:
+        return dtype
+    return np.dtype(dtype)
+
+class ARRAY(TYPE):
+    """
+    The metatype of numpy arrays, whose terms are
+    decided by their dtype, shape and memory layout
+    only, never by their elements.
+    """
+    def __isterm__(typ, trm):
+        np = modules.get("numpy")
+        if np is None or not isinstance(trm, np.ndarray):
+            return False
+        dtype = typ.__dict__.get("__dtype__")
+        if dtype is not None and not np.issubdtype(trm.dtype, dtype):
+            return False
+        if not _refines(trm.shape, typ.__dict__.get("__shape__")):
+            return False
+        order = typ.__dict__.get("__order__")
+        if order == "C":
+            return trm.flags.c_contiguous
+        if order == "F":
+            return trm.flags.f_contiguous
+        return True
+
+    def __issub__(typ, other):
+        if type(other) is not type(typ):
+            return False
+        dtype, other_dtype = typ.__dict__.get("__dtype__"), other.__dict__.get("__dtype__")
+        if other_dtype is not None:
+            if dtype is None or not _numpy().issubdtype(dtype, other_dtype):
+                return False
+        if not _refines(typ.__dict__.get("__shape__"), other.__dict__.get("__shape__")):
+            return False
+        order = other.__dict__.get("__order__")
+        return order is None or typ.__dict__.get("__order__") == order
+
+    def __call__(typ, dtype=None, shape=None, order=None, typesystem=None):
+        np = _numpy()
+        if typesystem is None:
+            typesystem = TYPESYSTEM
+        if dtype is not None:
+            dtype = _dtype(np, dtype)
+        shape = _shape(shape)
+        if order not in (None, "C", "F"):
+            raise TypeError(f"Wrong Array order '{order!r}': expected 'C', 'F' or None")
+
+        key = (id(typ), dtype, shape, order, id(typesystem))
+
+        def build():
+            params = []
+            if dtype is not None:
+                params.append(dtype.__name__ if isinstance(dtype, type) else str(dtype))
+            if shape is not None:
+                dims = ", ".join("..." if d is ... else "*" if d is None else str(d) for d in shape)
+                params.append(f"shape=({dims})")
+            if order is not None:
+                params.append(f"order={order}")
+            name = f"Array({', '.join(params)})"
+            return type.__new__(typ.__class__, name, (typ,), {
+                "__display__": name,
+                "__dtype__": dtype,
+                "__shape__": shape,
+                "__order__": order,
+                "__typesystems__": [typesystem],
+                "__recursive__": False,
+                "is_type": True
+            })
+
+        return _intern(key, build)
+
+    is_meta = True
+    __typesystems__ = [TYPESYSTEM]
+    __type__ = UNIVERSE(1)
+    __display__ = "ARRAY"
+    __null__ = NotDefined
+    __builtin__ = NotDefined
+
+class Array(metaclass=ARRAY):
+    """
+    The parametric type of numpy arrays.
+
+    : type(Array) is ARRAY
+    : isterm(x, Array(dtype, shape=(None, 3), order='C'))
+        iff 'x' is an ndarray whose dtype is a 'dtype',
+        with two dimensions, the last of size 3, and
+        C-contiguous
+    : null(Array) is NotDefined
+    """
+    is_type        = True
+    __recursive__  = False
+    __typesystems__ = [TYPESYSTEM]
+    __type__       = ARRAY
+    __display__    = "Array"
+    __dtype__      = None
+    __shape__      = None
+    __order__      = None
+    __null__       = NotDefined
+    __builtin__    = NotDefined
+
+TYPESYSTEM.add(ARRAY)
+TYPESYSTEM.add(Array)
@@ -1,4 +1,48 @@
 from functools import lru_cache as cache
+from typed.mods.core import name as _name, names as _name_list, null as _null, typeof, isterm, issub
+from typed.helper.core import _recursive, _pure, _shallow, _admits, _walk
+from typed.helper.batch import _mask, _first
+
+def _null_from_list(*types):
+    """
+    The null of the first of 'types' which has one.
+    """
+    from typed.mods.err import NotDefined
+    for t in types:
+        value = _null(t)
+        if value is not NotDefined:
+            return value
+    return None
+
+def _union(class_name, types, null, typesystem):
+    """
+    Build a type whose terms are the terms of some of
+    'types', spread out as '__alternatives__' when walked.
+    """
+    from typed.mods.meta.base import TYPE
+    class UNION(TYPE):
+        def __isterm__(cls, trm):
+            return any(isterm(trm, t) for t in cls.__types__)
+
+        def __issub__(cls, other):
+            others = getattr(other, "__dict__", {}).get("__alternatives__")
+            if others is None:
+                return all(issub(t, other) for t in cls.__types__)
+            return all(any(issub(t, o) for o in others) for t in cls.__types__)
+
+        def __issup__(cls, other):
+            return any(issub(other, t) for t in cls.__types__)
+
+    return type.__new__(UNION, class_name, (), {
+        '__display__': class_name,
+        '__types__': types,
+        '__alternatives__': types,
+        '__null__': null,
+        '__typesystems__': [typesystem],
+        '__recursive__': _recursive(*types),
+        '__pure__': _pure(*types),
+        'is_type': True
+    })
 
 @cache
 def Union(*types, typesystem=None):
@@ -9,7 +53,6 @@ def Union(*types, typesystem=None):
     """
     if not types:
         from typed.mods.types.base import Nill
-        from typed.mods.core import typeof
         return Nill
 
     if typesystem is None:
@@ -17,38 +60,16 @@ def Union(*types, typesystem=None):
         typesystem = TYPESYSTEM
 
     if typesystem.is_restrictive:
-        if not all(typeof(t, typesystem) in typesystem.__universes__ for t in types):
+        outside = [t for t in types if not _admits(typesystem, t)]
+        if outside:
             from typed.mods.err import TypeSystemErr
-            raise TypeSystemErr(
-                types=[t for t in types if typeof(t, typesystem) not in typesystem.__universes__],
-                typesystem=typesystem
-            )
+            raise TypeSystemErr(types=_name_list(*outside), typesystem=typesystem)
 
     if len(types) == 1:
         return types[0]
 
-    from typed.mods.meta.base import TYPE
-    class UNION(TYPE):
-        def __isterm__(cls, instance):
-            return any(isinstance(instance, t) for t in cls.__types__)
-
-        def __subclasscheck__(cls, subclass):
-            if subclass is cls:
-                return True
-            if hasattr(subclass, '__types__'):
-                return all(any(issubclass(st, ct) for ct in cls.__types__)
-                           for st in subclass.__types__)
-            return any(issubclass(subclass, t) for t in cls.__types__)
-
     class_name = f"Union({_name_list(*types)})"
-
-    __null__ = _null_from_list(*types)
-
-    return UNION(class_name, (), {
-        '__display__': class_name,
-        '__types__': types,
-        '__null__': __null__,
-    })
+    return _union(class_name, types, _null_from_list(*types), typesystem)
 
 @cache
 def Prod(*args):
@@ -64,13 +85,13 @@ def Prod(*args):
         > 'Prod(f, g, ...): Prod(f.domain, g.domain, ...) -> Prod(f.codomain, g.codomain, ...)'
     """
 
-    from typed.mods.types.base import TYPE, ABSTRACT
+    from typed.mods.types.base import TYPE
     from typed.mods.types.func import Typed
-    T = (Typed, TYPE, ABSTRACT)
+    T = (Typed, TYPE)
     if not args:
         from typed.mods.types.base import Nill
         return Nill
-    if all((not isinstance(f, (TYPE, ABSTRACT))) and isinstance(f, Typed) for f in args):
+    if all((not isinstance(f, TYPE)) and isinstance(f, Typed) for f in args):
         in_types = [Prod(*f.domain) if len(f.domain) > 1 else f.domain[0] for f in args]
         out_types = [f.codomain for f in args]
         domain_type = Prod(*in_types)
@@ -91,10 +112,10 @@ def Prod(*args):
         prod_mapper.__name__ = f"Prod({_name_list(*args)})"
         return Typed(prod_mapper)
 
-    elif len(args) == 2 and isinstance(args[0], (TYPE, ABSTRACT)) and isinstance(args[1], int) and args[1] > 0:
+    elif len(args) == 2 and isinstance(args[0], TYPE) and isinstance(args[1], int) and args[1] > 0:
         types = (args[0],) * args[1]
 
-    elif all(isinstance(t, (TYPE, ABSTRACT)) for t in args):
+    elif all(isinstance(t, TYPE) for t in args):
         types = args
 
     elif all(isinstance(t, T) for t in args):
@@ -113,39 +134,52 @@ def Prod(*args):
                     "Wrong type in Prod factory: \n"
                     f" ==> {_name(t)}: has unexpected type\n"
                      "     [expected_type] TYPE, __UNIVERSE__ or Typed\n"
-                    f"     [received_type] {_name(TYPE(t))}"
+                    f"     [received_type] {_name(typeof(t))}"
                 )
 
-    from typed.mods.meta.base import _TYPE_
-    from typed.mods.types.base import Tuple
-    class PROD(_TYPE_):
-        def __instancecheck__(cls, instance):
-            if not isinstance(instance, Tuple):
-                return False
-            if len(instance) != len(cls.__types__):
-                return False
-            return all(isinstance(x, t) for x, t in zip(instance, cls.__types__))
-
-        def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
-            if subclass is cls or subclass is Any or issubclass(subclass, tuple):
-                return True
-            if hasattr(subclass, '__bases__') and Tuple in subclass.__bases__ and hasattr(subclass, '__types__') and len(subclass.__types__) == len(cls.__types__):
-                return all(issubclass(st, ct) for st, ct in zip(subclass.__types__, cls.__types__))
-            return False
+    class PROD(TYPE):
+        def __isterm__(cls, trm):
+            return _walk(cls, trm) is None
+
+        def __walk__(cls, trm):
+            if not isinstance(trm, tuple) or len(trm) != len(cls.__types__):
+                return None
+            if _shallow():
+                return ()
+            return [
+                (f"__accepted_{i}__", (t,), (trm[i],), (i,))
+                for i, t in enumerate(cls.__types__)
+            ]
+
+        def __issub__(cls, other):
+            from typed.mods.meta.base import TUPLE
+            others = getattr(other, "__dict__", {}).get("__types__")
+            if isinstance(others, tuple) and issubclass(other, tuple):
+                return len(others) == len(cls.__types__) and all(
+                    issub(t, o) for t, o in zip(cls.__types__, others)
+                )
+            if type(other) is TUPLE:
+                return others is None or all(
+                    any(issub(t, o) for o in others) for t in cls.__types__
+                )
+            return NotImplemented
 
     def prod_new(cls, *args):
-        if len(args) == 1 and isinstance(args[0], Tuple):
+        if len(args) == 1 and isinstance(args[0], tuple):
             return tuple.__new__(cls, args[0])
         else:
             return tuple.__new__(cls, args)
 
     class_name = f"Prod({_name_list(*types)})"
-    return PROD(class_name, (tuple,), {
+    return type.__new__(PROD, class_name, (tuple,), {
         "__display__": class_name,
         '__types__': types,
         '__new__': prod_new,
-        "__null__": tuple(_null(t) for t in types)
+        "__null__": tuple(_null(t) for t in types),
+        "__typesystems__": list(types[0].__typesystems__),
+        "__recursive__": _recursive(*types),
+        "__pure__": _pure(*types),
+        "is_type": True
     })
 
 @cache
@@ -245,7 +279,9 @@ def Unprod(*args):
     return UNPROD(class_name, (Tuple,), {
         "__display__": class_name,
         '__types__': args,
-        "__null__": tuple(_null(t) for t in args)
+        "__null__": tuple(_null(t) for t in args),
+        "__recursive__": _recursive(*args),
+        "__pure__": _pure(*args)
     })
 
 @cache
@@ -293,13 +329,17 @@ def Inter(*types):
         return INTER(class_name, unique_types, {
             '__display__': class_name,
             '__types__': unique_types,
-            '__null__': __null__[0] if len(__null__) == 1 else None
+            '__null__': __null__[0] if len(__null__) == 1 else None,
+            '__recursive__': _recursive(*unique_types),
+            '__pure__': _pure(*unique_types)
         })
     except Exception:
         return INTER(class_name, (), {
             '__display__': class_name,
             '__types__': unique_types,
-            '__null__': __null__[0] if len(__null__) == 1 else None
+            '__null__': __null__[0] if len(__null__) == 1 else None,
+            '__recursive__': _recursive(*unique_types),
+            '__pure__': _pure(*unique_types)
         })
 
 @cache
@@ -322,7 +362,7 @@ def Filter(X, *conds):
             "Wrong type in Filter factory: \n"
             f" ==> '{_name(X)}': has unexpected type\n"
             "     [expected_type] TYPE\n"
-            f"     [received_type] '{_name(TYPE(X))}'"
+            f"     [received_type] '{_name(typeof(X))}'"
         )
 
     if not conds:
@@ -338,15 +378,15 @@ def Filter(X, *conds):
         if getattr(f, "is_lazy", False) and hasattr(f, "materialize"):
             f = f.materialize()
 
-        if isinstance(f, Condition) or TYPE(f) is CONDITION:
+        if isinstance(f, Condition) or typeof(f) is CONDITION:
             normalized_conditions.append(f)
             continue
 
         if callable(f):
-            from typed.mods.decorators import typed as _typed
+            from typed.mods.decorator import typed as _typed
             f_typed = _typed(f, lazy=False)
 
-            if isinstance(f_typed, Condition) or TYPE(f_typed) is CONDITION:
+            if isinstance(f_typed, Condition) or typeof(f_typed) is CONDITION:
                 normalized_conditions.append(f_typed)
                 continue
 
@@ -354,23 +394,39 @@ def Filter(X, *conds):
             "Wrong type in Filter factory: \n"
             f" ==> '{_name(f)}': has unexpected type\n"
             "     [expected_type] Condition\n"
-            f"     [received_type] '{_name(TYPE(f))}'"
+            f"     [received_type] '{_name(typeof(f))}'"
         )
 
-    class FILTER(TYPE(X)):
-        def __instancecheck__(cls, instance):
-            if not isinstance(instance, X):
-                return False
-            return all(cond(instance) for cond in cls.__conditions__)
+    class FILTER(typeof(X)):
+        def __isterm__(cls, trm):
+            return isterm(trm, X) and all(cond(trm) for cond in cls.__conditions__)
+
+        def mask(cls, values):
+            """
+            The boolean mask of the terms among 'values'. The
+            conditions are arbitrary functions, so each value
+            is checked on its own.
+            """
+            return _mask(cls, values, X)
+
+        def check_all(cls, values):
+            """
+            The index of the first of 'values' which is not
+            a term, or None if all of them are.
+            """
+            return _first(cls, values, X)
 
     class_name = f"Filter({_name(X)}; {_name_list(*normalized_conditions)})"
-    Filter_ = FILTER(class_name, (X,), {
+    Filter_ = type.__new__(FILTER, class_name, (X,), {
         "__display__": class_name,
         "__conditions__": tuple(normalized_conditions),
+        "__typesystems__": list(X.__typesystems__),
+        "__recursive__": _recursive(X),
+        "__pure__": False,
     })
 
     try:
-        Filter_.__null__ = _null(X) if isinstance(_null(X), Filter_) else None
+        Filter_.__null__ = _null(X) if isterm(_null(X), Filter_) else None
     except Exception:
         Filter_.__null__ = None
 
@@ -462,6 +518,8 @@ def Regex(regex):
     class_name = f"Regex({regex})"
     Regex_ = REGEX(class_name, (Str,), {
         "__display__": class_name,
+        "__recursive__": False,
+        "__pure__": True,
     })
     Regex_.__null__ = "" if isinstance("", Regex_) else None
     return Regex_
@@ -482,29 +540,28 @@ def Interval(typ, start, end, ops=('<=', '<=')):
     """
 
     from typed.mods.types.base import TYPE
-    from typed.mods.factories.meta import ATTR
 
     if not isinstance(typ, TYPE):
         raise TypeError(
             "Wrong type in Interval factory: \n"
             f" ==> '{_name(typ)}': has unexpected type\n"
             "     [expected_type] TYPE\n"
-            f"     [received_type] '{_name(TYPE(typ))}'"
+            f"     [received_type] '{_name(typeof(typ))}'"
         )
 
-    if not isinstance(start, typ):
+    if not isterm(start, typ):
         raise TypeError(
             "Wrong type in Interval factory: \n"
             f" ==> {start}: has unexpected type\n"
             f"     [expected_type] {_name(typ)}\n"
-            f"     [received_type] {_name(TYPE(start))}"
+            f"     [received_type] {_name(typeof(start))}"
         )
-    if not isinstance(end, typ):
+    if not isterm(end, typ):
         raise TypeError(
             "Wrong type in Interval factory: \n"
             f" ==> {end}: has unexpected type\n"
             f"     [expected_type] {_name(typ)}\n"
-            f"     [received_type] {_name(TYPE(end))}"
+            f"     [received_type] {_name(typeof(end))}"
         )
 
     from operator import le, lt, ge, gt
@@ -561,57 +618,58 @@ def Interval(typ, start, end, ops=('<=', '<=')):
     right_attr, right_func = _normalize_one(ops[1])
 
     for attr_name in (left_attr, right_attr):
-        if not isinstance(typ, ATTR(attr_name)):
+        if not hasattr(typ, attr_name):
             raise TypeError(
                 "Wrong type in Interval factory: \n"
                 f" ==> '{_name(typ)}': missing comparison '{attr_name}'\n"
-                f"     [expected_type] ATTR('{attr_name}')\n"
-                f"     [received_type] '{_name(TYPE(typ))}'"
+                f"     [expected] terms with '{attr_name}'\n"
+                f"     [received_type] '{_name(typeof(typ))}'"
             )
 
-    class INTERVAL(TYPE(typ)):
-        def __new__(
-            cls,
-            name,
-            bases,
-            dct,
-            base_type,
-            lower_bound,
-            upper_bound,
-            left_op,
-            right_op,
-        ):
-            dct['_base_type'] = base_type
-            dct['_lower_bound'] = lower_bound
-            dct['_upper_bound'] = upper_bound
-            dct['_left_op'] = left_op
-            dct['_right_op'] = right_op
-            return super().__new__(cls, name, bases, dct)
+    from functools import partial
+    from operator import and_
+    reflected = {le: ge, lt: gt, ge: le, gt: lt}
 
-        def __instancecheck__(cls, instance):
-            if not isinstance(instance, cls._base_type):
-                return False
+    def vector(arr):
+        return left_func(start, arr) & right_func(arr, end)
+
+    def known(values):
+        return map(
+            and_,
+            map(partial(left_func, start), values),
+            map(partial(reflected[right_func], end), values)
+        )
+
+    class INTERVAL(typeof(typ)):
+        def __isterm__(cls, trm):
             return (
-                cls._left_op(cls._lower_bound, instance)
-                and cls._right_op(instance, cls._upper_bound)
+                isterm(trm, cls.__base_type__)
+                and left_func(cls.__lower_bound__, trm)
+                and right_func(trm, cls.__upper_bound__)
             )
 
-        def __subclasscheck__(cls, subclass):
-            return issubclass(subclass, cls._base_type)
+        def mask(cls, values):
+            """
+            The boolean mask of the terms among 'values': a numpy
+            array for numeric arrays and buffers, else a list.
+            """
+            return _mask(cls, values, cls.__base_type__, vector, known)
+
+        def check_all(cls, values):
+            """
+            The index of the first of 'values' out of the
+            interval, or None if all of them are in it.
+            """
+            return _first(cls, values, cls.__base_type__, vector, known)
 
     null_value = None
     try:
-        if (
-            isinstance(start, typ)
-            and left_func(start, start)
-            and right_func(start, end)
-        ):
+        if left_func(start, start) and right_func(start, end):
             null_value = start
         else:
             candidate = _null(typ)
             if (
-                candidate is not None
-                and isinstance(candidate, typ)
+                isterm(candidate, typ)
                 and left_func(start, candidate)
                 and right_func(candidate, end)
             ):
@@ -620,19 +678,16 @@ def Interval(typ, start, end, ops=('<=', '<=')):
         null_value = None
 
     class_name = f"Interval({_name(typ)}, {start}, {end})"
-    return INTERVAL(
-        class_name,
-        (typ,),
-        {
-            "__display__": class_name,
-            "__null__": null_value,
-        },
-        base_type=typ,
-        lower_bound=start,
-        upper_bound=end,
-        left_op=left_func,
-        right_op=right_func,
-    )
+    return type.__new__(INTERVAL, class_name, (typ,), {
+        "__display__": class_name,
+        "__base_type__": typ,
+        "__lower_bound__": start,
+        "__upper_bound__": end,
+        "__null__": null_value,
+        "__typesystems__": list(typ.__typesystems__),
+        "__recursive__": _recursive(typ),
+        "__pure__": _pure(typ),
+    })
 
 @cache
 def Range(x, y, ops=('<=', '<=')):
@@ -667,7 +722,9 @@ def Not(*types):
     return NOT(class_name, (), {
         "__display__": class_name,
         '__types__': types,
-        '__null__': None
+        '__null__': None,
+        '__recursive__': _recursive(*types),
+        '__pure__': _pure(*types)
     })
 
 @cache
@@ -694,7 +751,9 @@ def Null(typ):
     class_name = f"Null({_name(typ)})"
     return NULL(class_name, (typ,), {
         "__display__": class_name,
-        "__null__": _null(typ)
+        "__null__": _null(typ),
+        "__recursive__": _recursive(typ),
+        "__pure__": _pure(typ)
     })
 
 @cache
@@ -722,35 +781,51 @@ def Enum(typ, *values):
                 "Wrong type in Enum factory: \n"
                 f" ==> {_name(typ)}: has unexpected type\n"
                  "     [expected_type] Typed\n"
-                f"     [received_type] {_name(TYPE(typ))}"
+                f"     [received_type] {_name(typeof(typ))}"
             )
         for value in values:
-            if not isinstance(value, typ):
+            if not isterm(value, typ):
                 raise TypeError(
                     "Wrong type in Enum factory: \n"
                     f" ==> {value}: has unexpected type\n"
                     f"     [expected_type] {_name(typ)}\n"
-                    f"     [received_type] {_name(TYPE(value))}"
+                    f"     [received_type] {_name(typeof(value))}"
                 )
     values_set = set(values)
-    class ENUM(TYPE(typ)):
-        def __instancecheck__(cls, instance):
-            return isinstance(instance, cls.__base_type__) and instance in cls.__allowed_values__
 
-        def __subclasscheck__(cls, subclass):
-            return issubclass(subclass, cls.__base_type__)
+    def vector(arr):
+        from numpy import isin
+        return isin(arr, list(values_set))
+
+    def known(values):
+        return map(values_set.__contains__, values)
+
+    class ENUM(typeof(typ)):
+        def __isterm__(cls, trm):
+            try:
+                return trm in cls.__allowed_values__ and isterm(trm, cls.__base_type__)
+            except TypeError:
+                return False
+
+        def mask(cls, values):
+            return _mask(cls, values, cls.__base_type__, vector, known)
 
-    class_name = f"Enum({_name(typ)}; {_name_list(*values)})"
+        def check_all(cls, values):
+            return _first(cls, values, cls.__base_type__, vector, known)
 
-    Enum_ = ENUM(class_name, (typ,), {
+    class_name = f"Enum({_name(typ)}; {', '.join(map(repr, values))})"
+    null_value = _null(typ)
+
+    return type.__new__(ENUM, class_name, (typ,), {
         "__display__": class_name,
-        '__base_type__': typ,
-        '__allowed_values__': values_set,
+        "__base_type__": typ,
+        "__allowed_values__": values_set,
+        "__null__": null_value if null_value in values_set else None,
+        "__typesystems__": list(typ.__typesystems__),
+        "__recursive__": _recursive(typ),
+        "__pure__": _pure(typ),
     })
 
-    Enum_.__null__ = _null(typ) if isinstance(_null(typ), Enum_) else None
-    return Enum_
-
 @cache
 def Single(x):
     """
@@ -772,7 +847,9 @@ def Single(x):
     return SINGLE(class_name, (t,), {
         "__display__": class_name,
         '__value__': x,
-        '__null__': x
+        '__null__': x,
+        '__recursive__': False,
+        '__pure__': True
     })
 Singleton = Single
 
@@ -830,7 +907,9 @@ def Len(typ, size):
     return LEN(class_name, (typ,), {
         "__display__": class_name,
         '__len__': size,
-        '__null__': _null(typ) if size == 0 else None
+        '__null__': _null(typ) if size == 0 else None,
+        '__recursive__': _recursive(typ),
+        '__pure__': _pure(typ)
     })
 
 @cache
@@ -840,23 +919,15 @@ def Maybe(*types):
         > An object of `Maybe(X, Y, ..)`
         > is `None` or an object of `X`, `Y`, ...
     """
-    from typed.mods.types.base import TYPE
+    from typed.mods.types.base import TYPE, Nill
     for typ in types:
         if not isinstance(typ, TYPE):
             raise TypeError(
-                "Wrong type in Len factory: \n"
+                "Wrong type in Maybe factory: \n"
                 f" ==> {_name(typ)}: has unexpected type\n"
                 f"     [expected_type] TYPE\n"
-                f"     [received_type] {_name(TYPE(typ))}"
+                f"     [received_type] {_name(typeof(typ))}"
             )
-    types_ = (TYPE(typ) for typ in types)
-    class MAYBE(*types_):
-        def __instancecheck__(cls, instance):
-            if any(isinstance(instance, typ) for typ in types) or instance is None:
-                return True
-            return False
+    from typed.mods.core import TYPESYSTEM
     class_name = f"Maybe({_name_list(*types)})"
-    return MAYBE(class_name, types, {
-        "__display__": class_name,
-        "__null__": _null_from_list(*types)
-    })
+    return _union(class_name, (*types, Nill), _null_from_list(*types), TYPESYSTEM)
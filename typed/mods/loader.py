@@ -85,11 +85,12 @@ def lazy(target):
         raise TypeError("lazy() expects a dict (module-level setup) or str (library proxy).")
 
 
-def __typed__(enabled=True, **configs):
+def __typed__(enabled=None, **configs):
     from sys import _getframe
     from typed.mods.config import config
 
-    config.enabled = enabled
+    if enabled is not None:
+        config.enabled = enabled
     for key, value in configs.items():
         if hasattr(config, key):
             setattr(config, key, value)
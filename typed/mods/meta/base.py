@@ -1,5 +1,11 @@
 from typed.mods.core import TYPESYSTEM, UNIVERSE, ABSTRACT
 from typed.mods.err import NotDefined
+from typed.helper.core import _dispatch, _sample, _walk, _buffer, _shallow
+from typed.mods.containers import (
+    TypedList, TypedSet, TypedDict,
+    TypedIterator, TypedIterable,
+    _stamped
+)
 
 TYPE = UNIVERSE(0)
 TYPE.__name__ = "TYPE"
@@ -42,7 +48,7 @@ class PARAMETRIC(TYPE):
     """
     def __isterm__(typ, trm):
         from typed.mods.types.func import Factory
-        from typed.mods.core import type
+        from typed.mods.core import typeof as type
         if hasattr(type(trm), "__call__"):
             return type(trm).__iter__ in Factory
         return False
@@ -95,14 +101,17 @@ class INT(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import Int
-        from typed.mods.core import type, issub
-        return isinstance(trm, int) or issub(type(trm), Int)
+        try:
+            return INT.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Int
+            return _dispatch(INT, Int, trm)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "INT"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -113,14 +122,17 @@ class FLOAT(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import Float
-        from typed.mods.core import type, issub
-        return isinstance(trm, float) or issub(type(trm), Float)
+        try:
+            return FLOAT.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Float
+            return _dispatch(FLOAT, Float, trm)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "FLOAT"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -131,14 +143,17 @@ class STR(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import Str
-        from typed.mods.core import type, issub
-        return isinstance(trm, str) or issub(type(trm), Str)
+        try:
+            return STR.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Str
+            return _dispatch(STR, Str, trm)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "STR"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -155,14 +170,17 @@ class BOOL(TYPE):
         yield False
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import Bool
-        from typed.mods.core import type, issub
-        return isinstance(trm, bool) or issub(type(trm), Bool)
+        try:
+            return BOOL.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Bool
+            return _dispatch(BOOL, Bool, trm)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "BOOL"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -173,15 +191,17 @@ class BYTES(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from builtins import bytes, bytearray
-        from typed.mods.types.base import Bytes
-        from typed.mods.core import type, issub
-        return isinstance(trm, (bytes, bytearray)) or issub(type(trm), Bytes)
+        try:
+            return BYTES.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Bytes
+            return _dispatch(BYTES, Bytes, trm, (bytes, bytearray))
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "BYTES"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -192,18 +212,24 @@ class TUPLE(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import Tuple
-        from typed.mods.core import type, issub, isterm
-
-        if not (isinstance(trm, tuple) or issub(type(trm), Tuple)):
-            return False
+        return _walk(typ, trm) is None
+
+    def __walk__(typ, trm):
+        try:
+            ok = TUPLE.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Tuple
+            ok = _dispatch(TUPLE, Tuple, trm)
+        if not ok:
+            return _buffer(typ, trm)
+        if _shallow():
+            return ()
 
         types = getattr(typ, '__types__', None)
-        if types is not None:
-            for x in trm:
-                if not any(isterm(x, t) for t in types):
-                    return False
-        return True
+        if not types:
+            return ()
+        keys, values = _sample(typ, trm, indexed=True)
+        return (("__accepted__", types, values, keys),)
 
     def __issub__(typ, other):
         from typed.mods.core import issub
@@ -220,30 +246,42 @@ class TUPLE(TYPE):
             return True
         return False
 
-    def __call__(typ, *types, typesystem=None):
+    def __call__(typ, *types, sample=None, typesystem=None):
         from typed.mods.core import TYPESYSTEM, names
+        from typed.helper.core import _recursive, _pure, _admits, _intern
         if typesystem is None:
             typesystem = TYPESYSTEM
 
         types_set = set(types)
         if typesystem.is_restrictive:
             for t in types_set:
-                if t not in typesystem.__types__:
-                    raise TypeError(f"Type {t} not in typesystem.__types__")
-
-        name = f"Tuple({names(*types_set)})" if types_set else "Tuple"
-
-        return TYPE(name, (typ,), {
-            "__display__": name,
-            "__types__": types_set,
-            "__typesystems__": [typesystem],
-            "is_type": True
-        })
+                if not _admits(typesystem, t):
+                    raise TypeError(f"Type {t} not in typesystem")
+
+        key = (id(typ), frozenset(map(id, types_set)), id(typesystem), sample)
+
+        def build():
+            params = names(*types_set)
+            if sample is not None:
+                params = f"{params}, sample={sample}" if params else f"sample={sample}"
+            name = f"Tuple({params})" if params else "Tuple"
+            return type.__new__(typ.__class__, name, (typ,), {
+                "__display__": name,
+                "__types__": types_set,
+                "__typesystems__": [typesystem],
+                "__recursive__": _recursive(*types_set),
+                "__pure__": sample is None and _pure(*types_set),
+                "__sample__": sample,
+                "is_type": True
+            })
+
+        return _intern(key, build)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "TUPLE"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -254,18 +292,26 @@ class LIST(TYPE):
     """
 
     def __isterm__(typ, trm):
-        from typed.mods.types.base import List
-        from typed.mods.core import type, issub, isterm
-
-        if not (isinstance(trm, list) or issub(type(trm), List)):
-            return False
+        return _walk(typ, trm) is None
+
+    def __walk__(typ, trm):
+        try:
+            ok = LIST.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import List
+            ok = _dispatch(LIST, List, trm)
+        if not ok:
+            return _buffer(typ, trm)
+        if isinstance(trm, TypedList) and _stamped(trm, typ):
+            return ()
+        if _shallow():
+            return ()
 
         types = getattr(typ, '__types__', None)
-        if types is not None:
-            for x in trm:
-                if not any(isterm(x, t) for t in types):
-                    return False
-        return True
+        if not types:
+            return ()
+        keys, values = _sample(typ, trm, indexed=True)
+        return (("__accepted__", types, values, keys),)
 
     def __issub__(typ, other):
         from typed.mods.core import issub
@@ -282,30 +328,42 @@ class LIST(TYPE):
             return True
         return False
 
-    def __call__(typ, *types, typesystem=None):
+    def __call__(typ, *types, sample=None, typesystem=None):
         from typed.mods.core import TYPESYSTEM, names
+        from typed.helper.core import _recursive, _pure, _admits, _intern
         if typesystem is None:
             typesystem = TYPESYSTEM
 
         types_set = set(types)
         if typesystem.is_restrictive:
             for t in types_set:
-                if t not in typesystem.__types__:
-                    raise TypeError(f"Type {t} not in typesystem.__types__")
-
-        name = f"List({names(*types_set)})" if types_set else "List"
-
-        return type.__new__(typ.__class__, name, (typ,), {
-            "__display__": name,
-            "__types__": types_set,
-            "__typesystems__": [typesystem],
-            "is_type": True
-        })
+                if not _admits(typesystem, t):
+                    raise TypeError(f"Type {t} not in typesystem")
+
+        key = (id(typ), frozenset(map(id, types_set)), id(typesystem), sample)
+
+        def build():
+            params = names(*types_set)
+            if sample is not None:
+                params = f"{params}, sample={sample}" if params else f"sample={sample}"
+            name = f"List({params})" if params else "List"
+            return type.__new__(typ.__class__, name, (typ,), {
+                "__display__": name,
+                "__types__": types_set,
+                "__typesystems__": [typesystem],
+                "__recursive__": _recursive(*types_set),
+                "__pure__": sample is None and _pure(*types_set),
+                "__sample__": sample,
+                "is_type": True
+            })
+
+        return _intern(key, build)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "LIST"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -315,19 +373,26 @@ class SET(TYPE):
     The metatype of sets.
     """
     def __isterm__(typ, trm):
-        from builtins import set as __Set__
-        from typed.mods.types.base import Set
-        from typed.mods.core import type, issub, isterm
-
-        if not (isinstance(trm, __Set__) or issub(type(trm), Set)):
-            return False
+        return _walk(typ, trm) is None
+
+    def __walk__(typ, trm):
+        try:
+            ok = SET.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Set
+            ok = _dispatch(SET, Set, trm)
+        if not ok:
+            return None
+        if isinstance(trm, TypedSet) and _stamped(trm, typ):
+            return ()
+        if _shallow():
+            return ()
 
         types = getattr(typ, '__types__', None)
-        if types is not None:
-            for x in trm:
-                if not any(isterm(x, t) for t in types):
-                    return False
-        return True
+        if not types:
+            return ()
+        values = _sample(typ, trm)
+        return (("__accepted__", types, values, values),)
 
     def __issub__(typ, other):
         from typed.mods.core import issub
@@ -344,30 +409,42 @@ class SET(TYPE):
             return True
         return False
 
-    def __call__(typ, *types, typesystem=None):
+    def __call__(typ, *types, sample=None, typesystem=None):
         from typed.mods.core import TYPESYSTEM, names
+        from typed.helper.core import _recursive, _pure, _admits, _intern
         if typesystem is None:
             typesystem = TYPESYSTEM
 
         types_set = set(types)
         if typesystem.is_restrictive:
             for t in types_set:
-                if t not in typesystem.__types__:
-                    raise TypeError(f"Type {t} not in typesystem.__types__")
-
-        name = f"Set({names(*types_set)})" if types_set else "Set()"
-
-        return type.__new__(typ.__class__, name, (typ,), {
-            "__display__": name,
-            "__types__": types_set,
-            "__typesystems__": [typesystem],
-            "is_type": True
-        })
+                if not _admits(typesystem, t):
+                    raise TypeError(f"Type {t} not in typesystem")
+
+        key = (id(typ), frozenset(map(id, types_set)), id(typesystem), sample)
+
+        def build():
+            params = names(*types_set)
+            if sample is not None:
+                params = f"{params}, sample={sample}" if params else f"sample={sample}"
+            name = f"Set({params})" if params else "Set()"
+            return type.__new__(typ.__class__, name, (typ,), {
+                "__display__": name,
+                "__types__": types_set,
+                "__typesystems__": [typesystem],
+                "__recursive__": _recursive(*types_set),
+                "__pure__": sample is None and _pure(*types_set),
+                "__sample__": sample,
+                "is_type": True
+            })
+
+        return _intern(key, build)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "SET"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
@@ -377,27 +454,34 @@ class DICT(TYPE):
     The metatype of dictionaries.
     """
     def __isterm__(typ, trm):
-        from builtins import dict as __Dict__
-        from typed.mods.types.base import Dict
-        from typed.mods.core import type, issub, isterm
-
-        if not (isinstance(trm, __Dict__) or issub(type(trm), Dict)):
-            return False
+        return _walk(typ, trm) is None
+
+    def __walk__(typ, trm):
+        try:
+            ok = DICT.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Dict
+            ok = _dispatch(DICT, Dict, trm)
+        if not ok:
+            return None
+        if isinstance(trm, TypedDict) and _stamped(trm, typ):
+            return ()
+        if _shallow():
+            return ()
 
         types = getattr(typ, "__types__", None)
         key_type = getattr(typ, "__key_type__", None)
-
-        if types is not None:
-            for v in trm.values():
-                if not any(isterm(v, t) for t in types):
-                    return False
-
-        if key_type is not None:
-            for k in trm.keys():
-                if not isterm(k, key_type):
-                    return False
-
-        return True
+        if not types and key_type is None:
+            return ()
+
+        keys = _sample(typ, trm)
+        if key_type is None:
+            values = trm.values() if keys is trm else [trm[k] for k in keys]
+            return (("__accepted__", types, values, keys),)
+        if not types:
+            return (("__accepted_keys__", (key_type,), keys, keys),)
+        items = trm.items() if keys is trm else [(k, trm[k]) for k in keys]
+        return ((("__accepted_keys__", "__accepted__"), ((key_type,), types), items, None),)
 
     def __issub__(typ, other):
         from typed.mods.core import issub
@@ -424,42 +508,154 @@ class DICT(TYPE):
             return True
         return False
 
-    def __call__(typ, *types, key=None, typesystem=None):
+    def __call__(typ, *types, key=None, sample=None, typesystem=None):
         from typed.mods.core import TYPESYSTEM, names, name
+        from typed.helper.core import _recursive, _pure, _admits, _intern
         if typesystem is None:
             typesystem = TYPESYSTEM
 
         types_set = set(types)
         if typesystem.is_restrictive:
             for t in types_set:
-                if t not in typesystem.__types__:
-                    raise TypeError(f"Type {t} not in typesystem.__types__")
-            if key is not None and key not in typesystem.__types__:
-                raise TypeError(f"Type {key} not in typesystem.__types__")
-
-        if key is not None:
-            display_name = f"Dict({names(*types_set)}, key={name(key)})" if types_set else f"Dict(key={name(key)})"
-        else:
-            display_name = f"Dict({names(*types_set)})" if types_set else "Dict()"
-
-        return TYPE(typ.__class__, display_name, (typ,), {
-            "__display__": display_name,
-            "__types__": types_set,
-            "__key_type__": key,
-            "__typesystems__": [typesystem],
-            "is_type": True
-        })
+                if not _admits(typesystem, t):
+                    raise TypeError(f"Type {t} not in typesystem")
+            if key is not None and not _admits(typesystem, key):
+                raise TypeError(f"Type {key} not in typesystem")
+
+        interned = (id(typ), frozenset(map(id, types_set)), id(key), id(typesystem), sample)
+
+        def build():
+            params = [names(*types_set)] if types_set else []
+            if key is not None:
+                params.append(f"key={name(key)}")
+            if sample is not None:
+                params.append(f"sample={sample}")
+            display_name = f"Dict({', '.join(params)})"
+
+            return type.__new__(typ.__class__, display_name, (typ,), {
+                "__display__": display_name,
+                "__types__": types_set,
+                "__key_type__": key,
+                "__typesystems__": [typesystem],
+                "__recursive__": _recursive(*types_set, *([key] if key is not None else [])),
+                "__pure__": sample is None and _pure(*types_set, *([key] if key is not None else [])),
+                "__sample__": sample,
+                "is_type": True
+            })
+
+        return _intern(interned, build)
 
     is_meta = True
     __typesystems__ = [TYPESYSTEM]
     __type__ = UNIVERSE(1)
     __display__ = "DICT"
+    __dispatch__ = {}
     __null__ = NotDefined
     __builtin__ = NotDefined
 
 
+class STREAM(TYPE):
+    """
+    The common base of ITERATOR and ITERABLE.
+    Elements are not checked by '__isterm__', which would
+    consume them, but by the '__wrapper__' that '__stream__'
+    wraps the terms in.
+    """
+    def __issub__(typ, other):
+        from typed.mods.core import issub
+        if type(other) is type(typ):
+            typ_types = getattr(typ, '__types__', None)
+            other_types = getattr(other, '__types__', None)
+            if typ_types is None and other_types is not None:
+                return False
+            if other_types is None:
+                return True
+            for t1 in typ_types:
+                if not any(issub(t1, t2) for t2 in other_types):
+                    return False
+            return True
+        return False
+
+    def __stream__(typ, trm):
+        if not getattr(typ, '__types__', None) or _shallow():
+            return trm
+        return type(typ).__wrapper__(typ, trm)
+
+    def __call__(typ, *types, typesystem=None):
+        from typed.mods.core import TYPESYSTEM, names
+        from typed.helper.core import _pure, _admits, _intern
+        if typesystem is None:
+            typesystem = TYPESYSTEM
+
+        types_set = set(types)
+        if typesystem.is_restrictive:
+            for t in types_set:
+                if not _admits(typesystem, t):
+                    raise TypeError(f"Type {t} not in typesystem")
+
+        key = (id(typ), frozenset(map(id, types_set)), id(typesystem))
+
+        def build():
+            name = f"{type(typ).__kind__}({names(*types_set)})"
+            return type.__new__(typ.__class__, name, (typ,), {
+                "__display__": name,
+                "__types__": types_set,
+                "__typesystems__": [typesystem],
+                "__recursive__": False,
+                "__pure__": _pure(*types_set),
+                "is_type": True
+            })
+
+        return _intern(key, build)
+
+    is_meta = True
+    __typesystems__ = [TYPESYSTEM]
+    __type__ = UNIVERSE(1)
+    __null__ = NotDefined
+    __builtin__ = NotDefined
+
+
+class ITERATOR(STREAM):
+    """
+    The metatype of iterators.
+    Elements are checked by the 'TypedIterator' that
+    '__stream__' wraps the terms in.
+    """
+    def __isterm__(typ, trm):
+        try:
+            return ITERATOR.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Iterator
+            return _dispatch(ITERATOR, Iterator, trm)
+
+    __display__ = "ITERATOR"
+    __dispatch__ = {}
+    __kind__ = "Iterator"
+    __wrapper__ = TypedIterator
+
+
+class ITERABLE(STREAM):
+    """
+    The metatype of iterables.
+    Elements are checked by the 'TypedIterable' that
+    '__stream__' wraps the terms in.
+    """
+    def __isterm__(typ, trm):
+        try:
+            return ITERABLE.__dispatch__[type(trm)]
+        except KeyError:
+            from typed.mods.types.base import Iterable
+            return _dispatch(ITERABLE, Iterable, trm)
+
+    __display__ = "ITERABLE"
+    __dispatch__ = {}
+    __kind__ = "Iterable"
+    __wrapper__ = TypedIterable
+
+
 TYPESYSTEM.add(
     EMPTY, PARAMETRIC, ANY,
     NILL, INT, FLOAT, STR, BOOL, BYTES,
-    TUPLE, LIST, SET, DICT
+    TUPLE, LIST, SET, DICT,
+    ITERATOR, ITERABLE
 )
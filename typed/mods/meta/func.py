@@ -1,6 +1,6 @@
 from builtins import type as __Type__
 from typed.mods.meta.base import TYPE, UNIVERSE
-from typed.mods.core import TYPESYSTEM, __UNIVERSE__, type, isterm, issub
+from typed.mods.core import TYPESYSTEM, __UNIVERSE__, typeof as type, isterm, issub
 from typed.mods.err import NotDefined, FuncErr, TypeSystemErr, TypeErr
 from typed.helper.func import _unwrap
 
@@ -266,21 +266,25 @@ class DOM_FUNC(FUNC):
         types = tuple(args)
 
         if all(isinstance(t, __Type__) for t in types):
+            from typed.helper.core import _admits, _intern
             if typesystem.is_restrictive:
                 for t in types:
-                    if t not in tuple(typesystem.__members__.values()):
+                    if not _admits(typesystem, t):
                         raise TypeSystemErr(
                             type=t,
                             typesystem=typesystem
                         )
 
-            name = f"DomFunc({names(*types)})"
-            return FUNC(name, (typ,), {
-                "__display__": name,
-                "__types__": types,
-                "__typesystems__": [typesystem],
-                "is_type": True
-            })
+            def build():
+                name = f"DomFunc({names(*types)})"
+                return FUNC(name, (typ,), {
+                    "__display__": name,
+                    "__types__": types,
+                    "__typesystems__": [typesystem],
+                    "is_type": True
+                })
+
+            return _intern((id(typ), tuple(map(id, types)), id(typesystem)), build)
 
         for t in types:
             wrong = [t for t in types if not isinstance(t, __Type__)]
@@ -319,7 +323,7 @@ class COD_FUNC(FUNC):
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name
+        from typed.mods.core import name as _name
         from typed.mods.core import TYPESYSTEM
         
         if typesystem is None:
@@ -393,7 +397,7 @@ class COMP_FUNC(DOM_FUNC, COD_FUNC):
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name_list, _name
+        from typed.mods.core import names as _name_list, name as _name
         from typed.mods.core import TYPESYSTEM
 
         if typesystem is None:
@@ -445,7 +449,7 @@ class DOM_HINTED(DOM_FUNC, PARTIAL):
             return True
         if not super().__isterm__(trm):
             return False
-        from typed.mods.helper.func import _is_domain_hinted, _hinted_domain
+        from typed.helper.func import _is_domain_hinted, _hinted_domain
         try:
             if not _is_domain_hinted(trm.func):
                 return False
@@ -461,7 +465,7 @@ class DOM_HINTED(DOM_FUNC, PARTIAL):
 
     def __call__(typ, *args, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name_list
+        from typed.mods.core import names as _name_list
         from typed.mods.core import TYPESYSTEM
         
         if typesystem is None:
@@ -504,7 +508,7 @@ class COD_HINTED(COD_FUNC, PARTIAL):
     """
     def __isterm__(typ, trm):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.func import _is_codomain_hinted, _hinted_codomain
+        from typed.helper.func import _is_codomain_hinted, _hinted_codomain
 
         if issub(TYPE(trm), typ):
             return True
@@ -525,7 +529,7 @@ class COD_HINTED(COD_FUNC, PARTIAL):
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name
+        from typed.mods.core import name as _name
         from typed.mods.core import TYPESYSTEM
         
         if typesystem is None:
@@ -575,7 +579,7 @@ class HINTED(COMP_FUNC, COD_HINTED, DOM_HINTED):
     def __isterm__(typ, trm):
         if not super().__isterm__(trm):
             return False
-        from typed.mods.helper.func import _hinted_domain, _hinted_codomain
+        from typed.helper.func import _hinted_domain, _hinted_codomain
         
         expected_types = getattr(typ, "__types__", None)
         expected_cod = getattr(typ, "__codomain__", None)
@@ -594,7 +598,7 @@ class HINTED(COMP_FUNC, COD_HINTED, DOM_HINTED):
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name_list, _name
+        from typed.mods.core import names as _name_list, name as _name
         from typed.mods.core import TYPESYSTEM
 
         if typesystem is None:
@@ -646,14 +650,14 @@ class DOM_TYPED(DOM_HINTED):
             return False
         expected = getattr(typ, "__types__", None)
         if expected is not None:
-            from typed.mods.helper.func import _hinted_domain
+            from typed.helper.func import _hinted_domain
             domain_hints = set(_hinted_domain(trm.func))
             return domain_hints == set(expected)
         return True
 
     def __call__(typ, *args, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name_list
+        from typed.mods.core import names as _name_list
         from typed.mods.core import TYPESYSTEM
         
         if typesystem is None:
@@ -700,14 +704,14 @@ class COD_TYPED(COD_HINTED):
             return False
         expected = getattr(typ, "__codomain__", None)
         if expected is not None:
-            from typed.mods.helper.func import _hinted_codomain
+            from typed.helper.func import _hinted_codomain
             return_hint = _hinted_codomain(trm.func)
             return return_hint == expected
         return True
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name
+        from typed.mods.core import name as _name
         from typed.mods.core import TYPESYSTEM
         
         if typesystem is None:
@@ -775,7 +779,7 @@ class TYPED(HINTED, DOM_TYPED, COD_TYPED):
         expected_cod = getattr(typ, "__codomain__", None)
         
         if expected_types is not None or expected_cod is not None:
-            from typed.mods.helper.func import _hinted_domain, _hinted_codomain
+            from typed.helper.func import _hinted_domain, _hinted_codomain
             from typed.mods.types.base import Any
             
             if expected_types is not None:
@@ -794,7 +798,7 @@ class TYPED(HINTED, DOM_TYPED, COD_TYPED):
 
     def __call__(typ, *args, cod=None, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE
-        from typed.mods.helper.general import _name_list, _name
+        from typed.mods.core import names as _name_list, name as _name
         from typed.mods.core import TYPESYSTEM
 
         if typesystem is None:
@@ -810,22 +814,26 @@ class TYPED(HINTED, DOM_TYPED, COD_TYPED):
             return typ
 
         if cod is not None and all(isterm(t, TYPE) for t in args):
+            from typed.helper.core import _admits, _intern
             types = tuple(args)
             if typesystem.is_restrictive:
                 for t in types:
-                    if t not in typesystem.__types__:
-                        raise TypeError(f"Type {t} not in typesystem.__types__")
-                if cod not in typesystem.__types__:
-                    raise TypeError(f"Type {cod} not in typesystem.__types__")
-
-            class_name = f"Typed({_name_list(*types)}, cod={_name(cod)})"
-            return __Type__.__new__(typ.__class__, class_name, (typ,), {
-                "__display__": class_name,
-                "__types__": types,
-                "__codomain__": cod,
-                "__typesystems__": [typesystem],
-                "is_type": True
-            })
+                    if not _admits(typesystem, t):
+                        raise TypeError(f"Type {t} not in typesystem")
+                if not _admits(typesystem, cod):
+                    raise TypeError(f"Type {cod} not in typesystem")
+
+            def build():
+                class_name = f"Typed({_name_list(*types)}, cod={_name(cod)})"
+                return __Type__.__new__(typ.__class__, class_name, (typ,), {
+                    "__display__": class_name,
+                    "__types__": types,
+                    "__codomain__": cod,
+                    "__typesystems__": [typesystem],
+                    "is_type": True
+                })
+
+            return _intern((id(typ), tuple(map(id, types)), id(cod), id(typesystem)), build)
 
         raise TypeError("Typed() expects a callable, or TYPE arguments plus cod=TYPE")
 
@@ -844,7 +852,7 @@ class CONDITION(TYPED):
 
     def __call__(typ, *args, typesystem=None, **kwargs):
         from typed.mods.types.base import TYPE, Bool
-        from typed.mods.helper.general import _name_list, _name
+        from typed.mods.core import names as _name_list, name as _name
         from typed.mods.core import TYPESYSTEM
 
         if typesystem is None:
@@ -863,20 +871,24 @@ class CONDITION(TYPED):
             return typ
 
         if args and all(isterm(t, TYPE) for t in args) and not kwargs:
+            from typed.helper.core import _admits, _intern
             types = tuple(args)
             if typesystem.is_restrictive:
                 for t in types:
-                    if t not in typesystem.__types__:
-                        raise TypeError(f"Type {t} not in typesystem.__types__")
-
-            class_name = f"Condition({_name_list(*types)})"
-            return __Type__.__new__(typ.__class__, class_name, (typ,), {
-                "__display__": class_name,
-                "__types__": types,
-                "__codomain__": Bool,
-                "__typesystems__": [typesystem],
-                "is_type": True
-            })
+                    if not _admits(typesystem, t):
+                        raise TypeError(f"Type {t} not in typesystem")
+
+            def build():
+                class_name = f"Condition({_name_list(*types)})"
+                return __Type__.__new__(typ.__class__, class_name, (typ,), {
+                    "__display__": class_name,
+                    "__types__": types,
+                    "__codomain__": Bool,
+                    "__typesystems__": [typesystem],
+                    "is_type": True
+                })
+
+            return _intern((id(typ), tuple(map(id, types)), id(typesystem)), build)
 
         raise TypeError("Condition() expects a Bool-returning callable, or TYPE arguments")
 
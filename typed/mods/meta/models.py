@@ -2,6 +2,8 @@ from typed.mods.meta.base import _TYPE_, DICT
 from typed.mods.meta.func import FACTORY
 from typed.mods.types.base import TYPE, Set, Dict
 from typed.mods.helper.general import _issubtype, _name
+from typed.helper.core import _checker
+from typed.mods.config import config
 
 def _single_field_inner_type_and_key(mcls):
     try:
@@ -233,7 +235,7 @@ class _MODEL_FACTORY_(FACTORY):
             if getattr(target_type, 'is_model', False) and isinstance(val, dict):
                 entity_dict[key] = target_type(**val)
 
-        if not cls.__instancecheck__(entity_dict):
+        if config.enabled and not cls.__instancecheck__(entity_dict):
             from typed.mods.models import validate
             validate(entity_dict, cls)
         obj = cls.__new__(cls)
@@ -463,7 +465,7 @@ class MODEL_META(_MODEL_FACTORY_, _MODEL_, _MODEL_INSTANCE_):
             if inner_type is not None:
                 ok = False
                 try:
-                    ok = instance in inner_type
+                    ok = _checker(inner_type)(instance)
                 except Exception:
                     checker = getattr(inner_type, '__instancecheck__', None)
                     ok = isinstance(instance, inner_type) or (callable(checker) and checker(instance))
@@ -484,7 +486,7 @@ class MODEL_META(_MODEL_FACTORY_, _MODEL_, _MODEL_INSTANCE_):
             v = instance[req_key]
             ok = False
             try:
-                ok = v in expected_type
+                ok = _checker(expected_type)(v)
             except Exception:
                 checker = getattr(expected_type, '__instancecheck__', None)
                 ok = isinstance(v, expected_type) or (callable(checker) and checker(v))
@@ -499,7 +501,7 @@ class MODEL_META(_MODEL_FACTORY_, _MODEL_, _MODEL_INSTANCE_):
                 expected_type = wrapper.type
                 ok = False
                 try:
-                    ok = v in expected_type
+                    ok = _checker(expected_type)(v)
                 except Exception:
                     checker = getattr(expected_type, '__instancecheck__', None)
                     ok = isinstance(v, expected_type) or (callable(checker) and checker(v))
@@ -3,6 +3,7 @@ from functools import lru_cache as cache
 from typed.mods.types.base import TYPE, Str, Dict, List, Bool, Any
 from typed.mods.factories.generics import Maybe
 from typed.mods.helper.general import _name
+from typed.helper.core import _checker
 from typed.mods.meta.models import (
     _MODEL_, _EXACT_, _ORDERED_, _RIGID_,
     _LAZY_MODEL_, _EAGER_MODEL_,
@@ -416,7 +417,7 @@ def validate(entity: Dict, model: MODEL) -> Dict:
                 else:
                     errors.append(f" ==> Unexpected attribute '{k}'.")
                     continue
-                if not (v in typ):
+                if not _checker(typ)(v):
                     errors.append(
                         f" ==> '{k}': wrong type.\n"
                         f"     [received_type]: '{_name(TYPE(v))}'\n"
@@ -448,7 +449,7 @@ def validate(entity: Dict, model: MODEL) -> Dict:
             else:
                 errors.append(f" ==> Unexpected attribute '{k}'.")
                 continue
-            if not (v in typ):
+            if not _checker(typ)(v):
                 errors.append(
                     f" ==> '{k}': wrong type.\n"
                     f"     [received_type]: '{_name(TYPE(v))}'\n"
@@ -483,7 +484,7 @@ def validate(entity: Dict, model: MODEL) -> Dict:
                 else:
                     errors.append(f" ==> Unexpected attribute '{k}'.")
                     continue
-                if not (v in typ):
+                if not _checker(typ)(v):
                     errors.append(
                         f" ==> '{k}': wrong type.\n"
                         f"     [received_type]: '{_name(TYPE(v))}'\n"
@@ -505,7 +506,7 @@ def validate(entity: Dict, model: MODEL) -> Dict:
         expected_type = required_attributes_and_types_raw[attr_name]
         if attr_name in entity:
             v = entity[attr_name]
-            if not (v in expected_type):
+            if not _checker(expected_type)(v):
                 errors.append(
                     f" ==> '{attr_name}': wrong type.\n"
                     f"     [received_type]: '{_name(TYPE(v))}'\n"
@@ -517,7 +518,7 @@ def validate(entity: Dict, model: MODEL) -> Dict:
             v = entity[attr_name]
             if _is_missing_optional_value(attr_name, v):
                 continue
-            if not (v in wrapper.type):
+            if not _checker(wrapper.type)(v):
                 errors.append(
                     f" ==> '{attr_name}': wrong type.\n"
                     f"     [received_type]: '{_name(TYPE(v))}'\n"
@@ -4,6 +4,7 @@ from typed.mods.meta.base import (
     TYPE, PARAMETRIC,
     STR, INT, FLOAT, BOOL, BYTES,
     TUPLE, LIST, SET, DICT,
+    ITERATOR, ITERABLE,
 )
 from builtins import (
     type  as __Type__,
@@ -17,6 +18,10 @@ from builtins import (
     dict  as __Dict__,
     bytes as __Bytes__
 )
+from collections.abc import (
+    Iterator as __Iterator__,
+    Iterable as __Iterable__
+)
 from typed.mods.err import NotDefined
 
 class Empty(metaclass=EMPTY):
@@ -30,6 +35,8 @@ class Empty(metaclass=EMPTY):
     : builtin(Empty) is  NotDefined
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = EMPTY
     __display__    = "Empty"
@@ -46,6 +53,8 @@ class Nill(metaclass=NILL):
     : builtin(Nill) is  NotDefined
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = NILL
     __display__    = "Nill"
@@ -61,6 +70,8 @@ class Any(metaclass=ANY):
     : builtin(Any)  is NotDefined
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = ANY
     __display__    = "Any"
@@ -77,6 +88,7 @@ class Type(metaclass=TYPE):
     : builtin(Type) is  type
     """
     is_type        = True
+    __recursive__  = False
     __typesystems__ = [TYPESYSTEM]
     __type__       = TYPE
     __display__    = "Type"
@@ -91,6 +103,7 @@ class Parametric(metaclass=PARAMETRIC):
     : null(Parametric) is NotDefined
     """
     is_type        = True
+    __recursive__  = False
     __typesystems__ = [TYPESYSTEM]
     __type__       = PARAMETRIC
     __display__    = "Parametric"
@@ -105,6 +118,9 @@ class Int(metaclass=INT):
     : builtin(Int) is int
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
+    __formats__    = frozenset("bBhHiIlLqQnN?")
     __typesystems__ = [TYPESYSTEM]
     __type__       = INT
     __display__    = "Int"
@@ -120,6 +136,9 @@ class Float(metaclass=FLOAT):
     : builtin(Float) is float
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
+    __formats__    = frozenset("efd")
     __typesystems__ = [TYPESYSTEM]
     __type__       = FLOAT
     __display__    = "Float"
@@ -135,6 +154,9 @@ class Bool(metaclass=BOOL):
     : builtin(Bool) is bool
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
+    __formats__    = frozenset("?")
     __typesystems__ = [TYPESYSTEM]
     __type__       = BOOL
     __display__    = "Bool"
@@ -153,6 +175,8 @@ class Str(metaclass=STR):
         return len(obj)
 
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = STR
     __display__    = "Str"
@@ -168,6 +192,8 @@ class Bytes(metaclass=BYTES):
     : builtin(Str) is bytes
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = BYTES
     __display__    = "Bytes"
@@ -184,6 +210,8 @@ class Tuple(metaclass=TUPLE):
     : builtin(Tuple) is tuple
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = TUPLE
     __display__    = "Tuple"
@@ -200,6 +228,8 @@ class List(metaclass=LIST):
     : builtin(List) is list
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = LIST
     __display__    = "List"
@@ -216,6 +246,8 @@ class Set(metaclass=SET):
     : builtin(Set) is set
     """
     is_type        = True
+    __recursive__  = False
+    __pure__       = True
     __typesystems__ = [TYPESYSTEM]
     __type__       = SET
     __display__    = "Set"
@@ -231,6 +263,8 @@ class Dict(metaclass=DICT):
     : builtin(Dict) is dict
     """
     is_type     = True
+    __recursive__ = False
+    __pure__      = True
     __typesystems__ = [TYPESYSTEM]
     __display__ = "Dict"
     __null__    = {}
@@ -243,9 +277,44 @@ class Dict(metaclass=DICT):
     def __contains__(trm, key):
         return key in trm.__dict__
 
+class Iterator(metaclass=ITERATOR):
+    """
+    The parametric type of iterators.
+
+    : type(Iterator)    is ITERATOR
+    : null(Iterator)    is iter(())
+    : builtin(Iterator) is collections.abc.Iterator
+    """
+    is_type        = True
+    __recursive__  = False
+    __pure__       = True
+    __typesystems__ = [TYPESYSTEM]
+    __type__       = ITERATOR
+    __display__    = "Iterator"
+    __null__       = iter(())
+    __builtin__    = __Iterator__
+
+class Iterable(metaclass=ITERABLE):
+    """
+    The parametric type of iterables.
+
+    : type(Iterable)    is ITERABLE
+    : null(Iterable)    is ()
+    : builtin(Iterable) is collections.abc.Iterable
+    """
+    is_type        = True
+    __recursive__  = False
+    __pure__       = True
+    __typesystems__ = [TYPESYSTEM]
+    __type__       = ITERABLE
+    __display__    = "Iterable"
+    __null__       = ()
+    __builtin__    = __Iterable__
+
 TYPESYSTEM.add(
     Type,
     Empty, Nill, Any,
     Int, Float, Str, Bool, Bytes,
-    List, Tuple, Set, Dict    
+    List, Tuple, Set, Dict,
+    Iterator, Iterable
 )
@@ -1,7 +1,12 @@
+from functools import partial
+from operator import attrgetter
 from builtins import callable as __Callable__
 from typed.mods.err import NotDefined
-from typed.mods.core import type, TYPESYSTEM
+from typed.mods.core import typeof as type, TYPESYSTEM
+from typed.mods.config import config
+from typed.helper.core import STATEFUL
 from typed.helper.func  import (
+    signature,
     _unwrap,
     _is_composable,
     _is_domain_hinted,
@@ -10,9 +15,13 @@ from typed.helper.func  import (
     _hinted_codomain,
     _check_domain,
     _check_codomain,
-    
+    _stream,
+    _compiled,
+    _inline,
+    _sampling,
+    HOT
 )
-from typed.mods.helper.general import _name
+from typed.mods.core import name as _name
 from typed.mods.meta.func import (
     CALLABLE,
     GENERATOR,
@@ -55,17 +64,17 @@ class Callable(metaclass=CALLABLE):
 
     @property
     def args(self):
-        from typed.helper.func import _args
+        from typed.helper.func import _get_args as _args
         return _args(self)
 
     @property
     def kwargs(self):
-        from typed.helper.func import _kwargs
+        from typed.helper.func import _get_kwargs as _kwargs
         return _kwargs(self)
 
     @property
     def posargs(self):
-        from typed.helper.func import _pos_args
+        from typed.helper.func import _get_pos_args as _pos_args
         return _pos_args(self)
 
     @property
@@ -254,7 +263,7 @@ class Partial(Func, metaclass=PARTIAL):
         self.is_lazy = getattr(func, "is_lazy", False)
 
         try:
-            from typed.mods.general import _
+            from typed.helper.core import _
             base = _unwrap(func)
 
             def _fmt_arg(a):
@@ -282,8 +291,7 @@ class Partial(Func, metaclass=PARTIAL):
             self._original_codomain = func.codomain
 
     def __call__(self, *new_args, **new_kwargs):
-        from typed.mods.general import _
-        from typed.mods.types.base import TYPE
+        from typed.helper.core import _
 
         effective_new_pos = [a for a in new_args if a is not _]
         effective_new_kw  = [v for v in new_kwargs.values() if v is not _]
@@ -302,7 +310,7 @@ class Partial(Func, metaclass=PARTIAL):
             else:
                 expected_type = self.domain
 
-            actual_type = TYPE(input_val)
+            actual_type = type(input_val)
 
             raise TypeError(
                 f"Domain mismatch in partial application '{_name(self)}':\n"
@@ -355,7 +363,7 @@ class Partial(Func, metaclass=PARTIAL):
                     if param_index < len(arg_list) and arg_list[param_index] is _:
                         arg_list[param_index] = kwarg_value
 
-        if _ in arg_list:
+        if any(a is _ for a in arg_list):
             new_partial = object.__new__(self.__class__)
             new_partial.__init__(self.func, arg_list, kwarg_dict)
             return new_partial
@@ -393,7 +401,7 @@ class Partial(Func, metaclass=PARTIAL):
 
     @property
     def domain(self):
-        from typed.mods.general import _
+        from typed.helper.core import _
         if not hasattr(self, '_original_domain'):
             return ()
 
@@ -503,10 +511,16 @@ class Hinted(CompFunc, DomHinted, CodHinted, metaclass=HINTED):
 
 class DomTyped(DomHinted, metaclass=DOM_TYPED):
     def __call__(self, *args, **kwargs):
+        return _compiled(self, DomTyped.__slow__, codomain=False)(*args, **kwargs)
+
+    def __slow__(self, *args, **kwargs):
         sig = signature(self.func)
         b = sig.bind(*args, **kwargs); b.apply_defaults()
         _check_domain(self.func, list(b.arguments.keys()), self.domain, None, list(b.arguments.values()))
         return self.func(*b.args, **b.kwargs)
+    @property
+    def inline(self):
+        return _inline(self)
     def __repr__(self):
         ds = ', '.join(t.__name__ for t in self.domain)
         return f"<DomTyped: {self.__name__}({ds}) runtime-checked>"
@@ -516,11 +530,13 @@ class DomTyped(DomHinted, metaclass=DOM_TYPED):
 
 class CodTyped(CodHinted, metaclass=COD_TYPED):
     def __call__(self, *args, **kwargs):
+        return _compiled(self, CodTyped.__slow__, domain=False)(*args, **kwargs)
+
+    def __slow__(self, *args, **kwargs):
         sig = signature(self.func)
         b = sig.bind(*args, **kwargs); b.apply_defaults()
         r = self.func(*b.args, **b.kwargs)
-        from typed.mods.types.base import TYPE
-        _check_codomain(self.func, _hinted_codomain(self.func), TYPE(r), r)
+        _check_codomain(self.func, _hinted_codomain(self.func), type(r), r)
         return r
     def __repr__(self):
         c = self.codomain.__name__
@@ -530,9 +546,42 @@ class CodTyped(CodHinted, metaclass=COD_TYPED):
         return f"{self.__name__} -> {c}!"
 
 class Typed(Hinted, DomTyped, CodTyped, metaclass=TYPED):
-    def __call__(self, *args, **kwargs):
-        from typed.mods.general import _
-        has_underscore = (_ in args) or any(v is _ for v in kwargs.values())
+    sample = None
+    every = None
+    backoff = None
+
+    __hot__ = HOT()
+    __call__ = property(attrgetter("__hot__"))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in ("sample", "every", "backoff"):
+            self.__dict__.pop("__hot__", None)
+
+    def __bind__(self):
+        """
+        The callable the calls of 'self' go through, decided
+        once from its sampling options and the config.
+        """
+        if self.every is not None or self.backoff is not None or config.every > 1 or config.backoff:
+            return partial(_sampling, self, Typed.__checked__)
+        if self.sample is None:
+            return _compiled(self, Typed.__slow__)
+        return partial(Typed.__slow__, self)
+
+    def __checked__(self, *args, **kwargs):
+        if self.sample is not None and STATEFUL.DEPTH.get():
+            return self.__slow__(*args, **kwargs)
+        return _compiled(self, Typed.__slow__)(*args, **kwargs)
+
+    @property
+    def calls(self):
+        sampler = self.__dict__.get("__sampler__")
+        return None if sampler is None else sampler.stats()
+
+    def __slow__(self, *args, **kwargs):
+        from typed.helper.core import _
+        has_underscore = any(a is _ for a in args) or any(v is _ for v in kwargs.values())
         if has_underscore:
             partial_instance = object.__new__(Partial)
             partial_instance.__init__(self, args, kwargs)
@@ -546,11 +595,14 @@ class Typed(Hinted, DomTyped, CodTyped, metaclass=TYPED):
             self.domain,
             None,
             list(b.arguments.values()),
+            sample=self.sample,
         )
+        for p_name, t in zip(list(b.arguments), self.domain):
+            b.arguments[p_name] = _stream(t, b.arguments[p_name])
         result = self.func(*b.args, **b.kwargs)
-        from typed.mods.types.base import TYPE
-        _check_codomain(self.func, _hinted_codomain(self.func), TYPE(result), result)
-        return result
+        codomain = _hinted_codomain(self.func)
+        _check_codomain(self.func, codomain, type(result), result, sample=self.sample)
+        return _stream(codomain, result)
     def __repr__(self):
         ds = ', '.join(t.__name__ for t in self.domain)
         cs = self.codomain.__name__
@@ -584,6 +636,9 @@ class Lazy(Hinted, metaclass=LAZY):
 
         self._wrapped = None
         self.is_lazy = True
+        self.sample = None
+        self.every = None
+        self.backoff = None
 
         self._lazy_domain = tuple(_hinted_domain(self.func))
         self._lazy_codomain = _hinted_codomain(self.func)
@@ -607,17 +662,20 @@ class Lazy(Hinted, metaclass=LAZY):
     def materialize(self):
         if self._wrapped is None:
             self._wrapped = Typed(self.func)
+            self._wrapped.sample = self.sample
+            self._wrapped.every = self.every
+            self._wrapped.backoff = self.backoff
         return self._wrapped
 
-    def __call__(self, *a, **kw):
-        from typed.mods.general import _
-        has_underscore = (_ in a) or any(v is _ for v in kw.values())
-        if has_underscore:
-            p = object.__new__(Partial)
-            p.__init__(self, a, kw)
-            return p
+    __hot__ = HOT()
+    __call__ = property(attrgetter("__hot__"))
 
-        return self.materialize()(*a, **kw)
+    def __bind__(self):
+        """
+        The callable of the materialized typed function.
+        """
+        wrapped = self.materialize()
+        return wrapped.__bind__()
 
     def __getattr__(self, name):
         return getattr(self.materialize(), name)